@@ -0,0 +1,45 @@
+"""add trigram search indexes to Instrument model
+
+Revision ID: 5f2a9c8e1d37
+Revises: c41e7d2b9f60
+Create Date: 2026-10-15 13:02:45.771203
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5f2a9c8e1d37"
+down_revision: Union[str, Sequence[str], None] = "c41e7d2b9f60"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEARCH_COLUMNS = ("market_and_symbol", "ig_epic", "yahoo_symbol")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for column in SEARCH_COLUMNS:
+        op.create_index(
+            f"ix_instruments_{column}_trgm",
+            "instruments",
+            [column],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"},
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for column in reversed(SEARCH_COLUMNS):
+        op.drop_index(
+            f"ix_instruments_{column}_trgm",
+            table_name="instruments",
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"},
+        )
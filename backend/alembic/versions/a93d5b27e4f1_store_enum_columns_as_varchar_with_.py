@@ -0,0 +1,66 @@
+"""store enum columns as varchar with check constraints
+
+Revision ID: a93d5b27e4f1
+Revises: b7d3e05a6c21
+Create Date: 2026-10-15 14:37:20.185946
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from app.db.enums import LogType, UserRole, UserSettingsMode, UserSettingsOrderType
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a93d5b27e4f1"
+down_revision: Union[str, Sequence[str], None] = "b7d3e05a6c21"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column, enum class); the native type names are SQLAlchemy's defaults
+ENUM_COLUMNS = (
+    ("users", "role", UserRole),
+    ("logs", "type", LogType),
+    ("user_settings", "mode", UserSettingsMode),
+    ("user_settings", "order_type", UserSettingsOrderType),
+)
+
+
+def _check_clause(column: str, enum_class) -> str:
+    members = ", ".join(f"'{member.name}'" for member in enum_class)
+    return f"{column} IN ({members})"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, column, enum_class in ENUM_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.String(length=32),
+            existing_nullable=False,
+            postgresql_using=f"{column}::text",
+        )
+        op.create_check_constraint(
+            f"ck_{enum_class.__name__.lower()}",
+            table,
+            _check_clause(column, enum_class),
+        )
+        op.execute(f"DROP TYPE IF EXISTS {enum_class.__name__.lower()}")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, column, enum_class in ENUM_COLUMNS:
+        type_name = enum_class.__name__.lower()
+        sa.Enum(enum_class, name=type_name).create(op.get_bind(), checkfirst=True)
+        op.drop_constraint(f"ck_{type_name}", table, type_="check")
+        op.alter_column(
+            table,
+            column,
+            type_=sa.Enum(enum_class, name=type_name),
+            existing_nullable=False,
+            postgresql_using=f"{column}::{type_name}",
+        )
@@ -0,0 +1,87 @@
+"""add webhook secret lookup hashes to UserSettings
+
+Revision ID: c41e7d2b9f60
+Revises: 96bb514845f3
+Create Date: 2026-10-15 12:14:36.402918
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c41e7d2b9f60"
+down_revision: Union[str, Sequence[str], None] = "96bb514845f3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "user_settings",
+        sa.Column(
+            "demo_webhook_secret_hash",
+            sa.LargeBinary(),
+            nullable=True,
+            comment="Lookup key for demo_webhook_secret",
+        ),
+    )
+    op.add_column(
+        "user_settings",
+        sa.Column(
+            "live_webhook_secret_hash",
+            sa.LargeBinary(),
+            nullable=True,
+            comment="Lookup key for live_webhook_secret",
+        ),
+    )
+
+    # Backfill the hashes for existing secrets; this must match
+    # app.services.utils.webhook_secret_lookup_hash
+    op.execute(
+        """
+        UPDATE user_settings
+        SET
+            demo_webhook_secret_hash = substring(
+                sha256(convert_to(demo_webhook_secret, 'UTF8')) FROM 1 FOR 8
+            ),
+            live_webhook_secret_hash = substring(
+                sha256(convert_to(live_webhook_secret, 'UTF8')) FROM 1 FOR 8
+            )
+        """
+    )
+
+    op.create_index(
+        "ix_user_settings_demo_webhook_secret_hash",
+        "user_settings",
+        ["demo_webhook_secret_hash"],
+        unique=False,
+        postgresql_using="hash",
+    )
+    op.create_index(
+        "ix_user_settings_live_webhook_secret_hash",
+        "user_settings",
+        ["live_webhook_secret_hash"],
+        unique=False,
+        postgresql_using="hash",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "ix_user_settings_live_webhook_secret_hash",
+        table_name="user_settings",
+        postgresql_using="hash",
+    )
+    op.drop_index(
+        "ix_user_settings_demo_webhook_secret_hash",
+        table_name="user_settings",
+        postgresql_using="hash",
+    )
+    op.drop_column("user_settings", "live_webhook_secret_hash")
+    op.drop_column("user_settings", "demo_webhook_secret_hash")
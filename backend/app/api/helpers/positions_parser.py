@@ -4,18 +4,29 @@ Helpers for parsing IG positions data into our Position schema.
 
 import logging
 from decimal import Decimal
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from app.api.helpers.ig_utils import parse_ig_datetime
-from app.db.crud import get_market_and_symbol_by_ig_epic
+from app.db.crud import (
+    get_market_and_symbol_by_ig_epic,
+    get_market_and_symbols_by_ig_epics,
+)
 from app.db.models import User
 from app.api.schemas.positions import Position
-from app.clients.ig.types import PositionData
+from app.clients.ig.types import MarketData, PositionData
 from sqlalchemy.ext.asyncio import AsyncSession
 
 logger = logging.getLogger(__name__)
 
 
+def _market_price(market_data: MarketData, field: str) -> Optional[Decimal]:
+    """Convert a float market price to Decimal, or None if IG did not send it."""
+    value = getattr(market_data, field)
+    if value is None:
+        return None
+    return Decimal(str(value))
+
+
 def _calculate_profit_loss_from_net_change(
     direction: str, net_change: Optional[Decimal], size: int, open_level: Decimal
 ) -> tuple[Optional[Decimal], Optional[Decimal]]:
@@ -54,7 +65,10 @@ def _calculate_profit_loss_from_net_change(
 
 
 async def parse_ig_position_to_schema(
-    ig_position_data: PositionData, user: User, db: AsyncSession
+    ig_position_data: PositionData,
+    user: User,
+    db: AsyncSession,
+    market_and_symbols: Optional[Dict[str, str]] = None,
 ) -> Optional[Position]:
     """
     Parse a single IG position data object into our Position schema.
@@ -63,6 +77,8 @@ async def parse_ig_position_to_schema(
         ig_position_data: Typed IG position data from API
         user: User object for database lookups
         db: Database session
+        market_and_symbols: Prefetched ig_epic -> market_and_symbol mapping;
+            looked up individually when not given
 
     Returns:
         Position object or None if parsing fails
@@ -75,12 +91,18 @@ async def parse_ig_position_to_schema(
         return None
 
     # Get market_and_symbol from user's instruments
-    market_and_symbol = await get_market_and_symbol_by_ig_epic(
-        db, user.id, market_data.epic
-    )
+    if market_and_symbols is not None:
+        market_and_symbol = market_and_symbols.get(market_data.epic)
+    else:
+        market_and_symbol = await get_market_and_symbol_by_ig_epic(
+            db, user.id, market_data.epic
+        )
 
-    # Extract netChange from market data directly (no need for .get() since it's typed)
-    net_change = market_data.net_change
+    # Market prices are floats on the IG model; convert once so the P&L maths
+    # below stays in Decimal alongside the position's own levels
+    net_change = _market_price(market_data, "net_change")
+    bid = _market_price(market_data, "bid")
+    offer = _market_price(market_data, "offer")
 
     # Calculate current level and profit/loss using appropriate current price
     # For accurate P&L calculation, we use:
@@ -92,14 +114,14 @@ async def parse_ig_position_to_schema(
 
     # Use bid price for BUY positions (price you can sell at to close)
     # Use offer price for SELL positions (price you can buy at to close)
-    if position_data.direction == "BUY" and market_data.bid is not None:
-        current_level = market_data.bid
+    if position_data.direction == "BUY" and bid is not None:
+        current_level = bid
         price_diff = current_level - position_data.level
         profit_loss = price_diff * position_data.size
         if position_data.level != 0:
             profit_loss_percentage = (price_diff / position_data.level) * Decimal("100")
-    elif position_data.direction == "SELL" and market_data.offer is not None:
-        current_level = market_data.offer
+    elif position_data.direction == "SELL" and offer is not None:
+        current_level = offer
         price_diff = position_data.level - current_level
         profit_loss = price_diff * position_data.size
         if position_data.level != 0:
@@ -165,8 +187,15 @@ async def parse_ig_positions_to_schema(
     """
     positions = []
 
+    # One query for every epic instead of one per position
+    market_and_symbols = await get_market_and_symbols_by_ig_epics(
+        db, user.id, [data.market.epic for data in ig_positions_data]
+    )
+
     for ig_position_data in ig_positions_data:
-        position = await parse_ig_position_to_schema(ig_position_data, user, db)
+        position = await parse_ig_position_to_schema(
+            ig_position_data, user, db, market_and_symbols
+        )
         if position:
             positions.append(position)
 
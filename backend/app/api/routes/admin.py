@@ -9,7 +9,7 @@ from app.db.models import AppSettings, User
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastcrud import FastCRUD
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.db.crud import get_app_settings
+from app.db.crud import get_app_settings, invalidate_app_settings
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
@@ -58,6 +58,7 @@ async def update_app_settings(
         await app_settings_crud.update(db, id=1, object=settings_update.model_dump())
 
         await db.commit()
+        invalidate_app_settings()
 
         return SimpleResponseSchema(message="App settings updated successfully")
 
@@ -96,16 +96,11 @@ async def register_user(
         password_hash=hashed_password,
         first_name=payload.first_name,
         last_name=payload.last_name,
+        settings=UserSettings(),
     )
 
+    # The unit of work inserts both rows in one transaction
     db.add(new_user)
-
-    await db.commit()
-    await db.refresh(new_user)
-
-    new_user_settings = UserSettings(user_id=new_user.id)
-
-    db.add(new_user_settings)
     await db.commit()
 
     access_token = create_access_token(
@@ -118,7 +113,7 @@ async def register_user(
     )
     await update_user(
         db,
-        email=new_user.email,
+        user=new_user,
         user_data={
             "refresh_token": refresh_token,
             "last_login": datetime.datetime.now(datetime.timezone.utc),
@@ -176,7 +171,7 @@ async def login(
     )
     await update_user(
         db,
-        email=user.email,
+        user=user,
         user_data={
             "refresh_token": refresh_token,
             "last_login": datetime.datetime.now(datetime.timezone.utc),
@@ -331,7 +326,7 @@ async def generate_access_token(
         expires_delta=timedelta(seconds=settings.REFRESH_TOKEN_LIFETIME_IN_SECONDS),
     )
 
-    await update_user(db, email=user.email, user_data={"refresh_token": refresh_token})
+    await update_user(db, user=user, user_data={"refresh_token": refresh_token})
 
     response = JSONResponse(
         status_code=status.HTTP_200_OK,
@@ -386,9 +381,7 @@ async def logout(
         data={"sub": user.email},
         expires_delta=timedelta(seconds=settings.REFRESH_TOKEN_LIFETIME_IN_SECONDS),
     )
-    await update_user(
-        db, email=user.email, user_data={"refresh_token": new_refresh_token}
-    )
+    await update_user(db, user=user, user_data={"refresh_token": new_refresh_token})
 
     await log_message(
         user_id=user.id,
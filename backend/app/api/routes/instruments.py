@@ -3,7 +3,7 @@ import io
 import logging
 import uuid
 from decimal import Decimal
-from typing import Annotated
+from typing import Annotated, List
 from aiocache import caches
 from app.api.exceptions import APIException
 from app.api.schemas.instruments import (
@@ -37,6 +37,7 @@ from fastapi import (
     status,
 )
 from fastcrud import FastCRUD
+from pydantic import TypeAdapter
 from sqlalchemy import delete
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -44,6 +45,9 @@ router = APIRouter(prefix="/instruments", tags=["instruments"])
 
 instrument_crud = FastCRUD(Instrument)
 
+# Built once at import so search results are validated as a single list
+INSTRUMENT_LIST_ADAPTER = TypeAdapter(List[InstrumentRead])
+
 logger = logging.getLogger(__name__)
 
 
@@ -73,10 +77,9 @@ async def search_instruments(
 
             # Convert to response format
             result_data = {
-                "data": [
-                    InstrumentRead.model_validate(instrument)
-                    for instrument in result_data["data"]
-                ],
+                "data": INSTRUMENT_LIST_ADAPTER.validate_python(
+                    result_data["data"], from_attributes=True
+                ),
                 "total_count": result_data["total_count"],
             }
         else:
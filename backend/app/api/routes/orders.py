@@ -2,7 +2,7 @@ import logging
 from typing import Annotated, List
 
 from app.api.helpers.orders_parser import parse_ig_orders_to_schema
-from app.api.schemas.orders import Order
+from app.api.schemas.orders import Order, PaginatedOrdersResponse, dump_orders_page
 from app.api.schemas.generic import SimpleResponseSchema
 from app.api.utils.authentication import get_current_user
 from app.api.utils.caching import cache_user_data, cache_with_pagination
@@ -10,14 +10,18 @@ from app.api.utils.pagination import *
 from app.api.utils.pagination import PaginationParams, build_paginated_response
 from app.clients.ig.client import IGClient
 from app.clients.ig.exceptions import IGAPIError, IGAuthenticationError
-from app.clients.ig.types import DeleteWorkingOrderRequest
+from app.clients.ig.types import DeleteWorkingOrderRequest, WorkingOrderData
 from app.db.models import User
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from pydantic import TypeAdapter
 
 router = APIRouter(prefix="/orders", tags=["orders"])
 
 logger = logging.getLogger(__name__)
 
+# Dumps the whole working order list in one call rather than per-object
+WORKING_ORDERS_ADAPTER = TypeAdapter(List[WorkingOrderData])
+
 
 @cache_user_data(ttl=60, namespace="ig_orders")
 async def get_all_orders_from_ig(user: User) -> List[Order]:
@@ -27,29 +31,22 @@ async def get_all_orders_from_ig(user: User) -> List[Order]:
     """
     ig_client = await IGClient.create_for_user(user)
     ig_response = await ig_client.get_working_orders()
-    ig_orders_data = [
-        order.model_dump(by_alias=True) for order in ig_response.working_orders
-    ]
+    ig_orders_data = WORKING_ORDERS_ADAPTER.dump_python(
+        ig_response.working_orders, by_alias=True
+    )
 
     orders = parse_ig_orders_to_schema(ig_orders_data)
     return orders
 
 
-@router.get("", response_model=PaginatedResponse[Order])
 @cache_with_pagination(ttl=30, namespace="orders")
-async def list_orders(
+async def get_orders_page(
     request: Request,
-    pagination: Annotated[PaginationParams, Depends()],
-    user: Annotated[User, Depends(get_current_user)],
-) -> PaginatedResponse[Order]:
+    pagination: PaginationParams,
+    user: User,
+) -> PaginatedOrdersResponse:
     """
-    Get a list of working orders from IG with pagination.
-
-    This endpoint retrieves all working orders from IG, transforms them to our schema,
-    and applies pagination. Both the raw IG data and paginated results are cached.
-
-    Returns:
-        PaginatedOrdersResponse: Contains 'data' (list of orders), 'count', 'next', and 'previous' URLs
+    Build one page of the user's working orders and cache it.
     """
     try:
         all_orders = await get_all_orders_from_ig(user)
@@ -90,6 +87,25 @@ async def list_orders(
         )
 
 
+@router.get("", response_model=PaginatedOrdersResponse)
+async def list_orders(
+    request: Request,
+    pagination: Annotated[PaginationParams, Depends()],
+    user: Annotated[User, Depends(get_current_user)],
+) -> Response:
+    """
+    Get a list of working orders from IG with pagination.
+
+    This endpoint retrieves all working orders from IG, transforms them to our schema,
+    and applies pagination. Both the raw IG data and paginated results are cached.
+
+    Returns:
+        PaginatedOrdersResponse: Contains 'data' (list of orders), 'count', 'next', and 'previous' URLs
+    """
+    page = await get_orders_page(request=request, pagination=pagination, user=user)
+    return Response(content=dump_orders_page(page), media_type="application/json")
+
+
 @router.delete("/{deal_id}", response_model=SimpleResponseSchema)
 async def delete_working_order(
     deal_id: str,
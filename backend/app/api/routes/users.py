@@ -19,7 +19,7 @@ from app.api.utils.pagination import (
 from app.clients.ig import IGClient
 from app.db.models import AppSettings
 from app.api.utils.admin import get_app_settings
-from app.db.crud import update_user
+from app.db.crud import update_user, with_webhook_secret_hashes
 from app.db.deps import get_db
 from app.db.models import User, UserSettings
 from app.services.logging import log_message
@@ -137,7 +137,7 @@ async def update_user_settings(
 
         updated_settings = await user_settings_crud.update(
             db,
-            update_data,
+            with_webhook_secret_hashes(update_data),
             schema_to_select=UserSettingsRead,
             return_as_model=True,
             user_id=user.id,
@@ -174,9 +174,7 @@ async def change_password(
         new_password_hash = hash_password(payload.new_password)
 
         # Update password in database
-        await update_user(
-            db, email=user.email, user_data={"password_hash": new_password_hash}
-        )
+        await update_user(db, user=user, user_data={"password_hash": new_password_hash})
 
         logger.info(f"Password changed successfully for user {user.email}")
 
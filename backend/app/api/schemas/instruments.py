@@ -1,24 +1,24 @@
 import uuid
 from datetime import datetime, timezone
 from decimal import Decimal
-from typing import Any, Optional, TypeVar
+from typing import Annotated, Optional, TypeVar
 
-from pydantic import AwareDatetime, BaseModel, Field, field_validator
+from pydantic import AfterValidator, AwareDatetime, BaseModel, Field
 
 T = TypeVar("T")
 
 
-def ensure_timezone_aware(v: Any) -> datetime:
+def ensure_timezone_aware(v: datetime) -> datetime:
     """Convert naive datetime to UTC timezone-aware datetime."""
-    if v is None:
-        return v
-    if isinstance(v, datetime):
-        if v.tzinfo is None:
-            return v.replace(tzinfo=timezone.utc)
-        return v
+    if v.tzinfo is None:
+        return v.replace(tzinfo=timezone.utc)
     return v
 
 
+# Postgres hands back aware values already; SQLite (local dev) returns naive ones
+UTCDatetime = Annotated[datetime, AfterValidator(ensure_timezone_aware)]
+
+
 class InstrumentBase(BaseModel):
     market_and_symbol: str = Field(..., description="Market and symbol identifier")
     ig_epic: str = Field(..., description="IG trading epic")
@@ -85,14 +85,14 @@ class InstrumentUpdate(BaseModel):
 
 class InstrumentRead(InstrumentBase):
     id: uuid.UUID
-    created_at: AwareDatetime
-    updated_at: AwareDatetime
-
-    @field_validator("created_at", "updated_at", "next_dividend_date", mode="before")
-    @classmethod
-    def ensure_timezone_aware_validator(cls, v: Any) -> datetime:
-        """Ensure datetime fields are timezone-aware, defaulting to UTC."""
-        return ensure_timezone_aware(v)
+    created_at: UTCDatetime
+    updated_at: UTCDatetime
+    next_dividend_date: Optional[UTCDatetime] = Field(
+        None, description="Next dividend date"
+    )
+    last_alert_received_at: Optional[UTCDatetime] = Field(
+        None, description="Timestamp of the last alert received"
+    )
 
     class Config:
         from_attributes = True
@@ -1,6 +1,7 @@
 from decimal import Decimal
-from typing import Literal, Optional
-from pydantic import BaseModel, AwareDatetime
+from typing import Any, Literal, Optional, Union
+from app.api.utils.pagination import PaginatedResponse
+from pydantic import BaseModel, AwareDatetime, TypeAdapter
 
 # Order type can be either MARKET, LIMIT, or STOP
 type WorkingOrderType = Literal["LIMIT", "MARKET", "STOP"]
@@ -18,3 +19,19 @@ class Order(BaseModel):
     entry_level: Decimal
     stop_level: Optional[Decimal] = None
     profit_level: Optional[Decimal] = None
+
+
+PaginatedOrdersResponse = PaginatedResponse[Order]
+
+# Built once at import so each response skips generic resolution and schema build
+_ORDERS_PAGE_ADAPTER = TypeAdapter(PaginatedOrdersResponse)
+
+
+def dump_orders_page(page: Union[PaginatedOrdersResponse, dict[str, Any]]) -> bytes:
+    """
+    Serialize a page of orders to JSON.
+
+    Accepts either the page model or its cached dict form; a model instance
+    passes through validation untouched.
+    """
+    return _ORDERS_PAGE_ADAPTER.dump_json(_ORDERS_PAGE_ADAPTER.validate_python(page))
@@ -1,7 +1,7 @@
 import asyncio
 import logging
 from datetime import datetime, timedelta, timezone
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 import httpx
 from aiocache import caches, RedisCache
@@ -16,6 +16,7 @@ from .caching import cache_client_request
 from .exceptions import IGAPIError, IGAuthenticationError, MissingCredentialsError
 from .logging import async_request_hook, async_response_hook
 from .retries import ig_api_retry
+from .structs import HISTORY_DECODER, POSITIONS_DECODER
 from .types import *
 
 logger = logging.getLogger(__name__)
@@ -346,8 +347,7 @@ class IGClient:
                 error_code=data.get("errorCode"),
             )
 
-        data = self._safe_json(response)
-        return GetHistoryResponse(**data)
+        return HISTORY_DECODER.decode(response.content).to_pydantic()
 
     @cache_client_request(ttl=POSITIONS_AND_WORKING_ORDERS_CACHE_TTL)
     @ig_api_retry
@@ -369,8 +369,29 @@ class IGClient:
                 error_code=data.get("errorCode"),
             )
 
-        data = self._safe_json(response)
-        return PositionsResponse(**data)
+        return POSITIONS_DECODER.decode(response.content).to_pydantic()
+
+    @cache_client_request(ttl=POSITIONS_AND_WORKING_ORDERS_CACHE_TTL)
+    @ig_api_retry
+    async def get_positions_fast(self) -> List[PositionDataTD]:
+        """
+        Retrieve open positions as lightweight TypedDicts for internal checks.
+        """
+        response = await self.client.get("positions", headers={"Version": "2"})
+
+        # Handle non-200 responses appropriately for retry logic
+        if response.status_code >= 500 or response.status_code == 429:
+            response.raise_for_status()
+
+        if not response.is_success:
+            data = self._safe_json(response)
+            raise IGAPIError(
+                message=data.get("errorCode", "Unknown error"),
+                status_code=response.status_code,
+                error_code=data.get("errorCode"),
+            )
+
+        return parse_positions_fast(response.content)
 
     @ig_api_retry
     async def create_position(
@@ -420,8 +441,29 @@ class IGClient:
                 error_code=data.get("errorCode"),
             )
 
-        data = self._safe_json(response)
-        return WorkingOrdersResponse(**data)
+        return ORDERS_ADAPTER.validate_json(response.content)
+
+    @cache_client_request(ttl=POSITIONS_AND_WORKING_ORDERS_CACHE_TTL)
+    @ig_api_retry
+    async def get_working_orders_fast(self) -> List[WorkingOrderDataTD]:
+        """
+        Retrieve working orders as lightweight TypedDicts for internal checks.
+        """
+        response = await self.client.get("workingorders", headers={"Version": "2"})
+
+        # Handle non-200 responses appropriately for retry logic
+        if response.status_code >= 500 or response.status_code == 429:
+            response.raise_for_status()
+
+        if not response.is_success:
+            data = self._safe_json(response)
+            raise IGAPIError(
+                message=data.get("errorCode", "Unknown error"),
+                status_code=response.status_code,
+                error_code=data.get("errorCode"),
+            )
+
+        return parse_working_orders_fast(response.content)
 
     @ig_api_retry
     async def create_working_order(
@@ -525,8 +567,7 @@ class IGClient:
                 error_code=data.get("errorCode"),
             )
 
-        data = self._safe_json(response)
-        return DealConfirmation(**data)
+        return DealConfirmation.model_validate_json(response.content)
 
     @ig_api_retry
     async def get_position_by_deal_id(
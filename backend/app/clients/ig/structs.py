@@ -0,0 +1,187 @@
+"""
+msgspec mirrors of the high-volume IG response models.
+
+Positions and history come back in bulk and are only ever read, so they are
+decoded with msgspec and converted to the pydantic models afterwards via
+``to_pydantic()``. Request-side models stay pydantic-only.
+"""
+
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import List, Literal, Optional
+
+import msgspec
+
+from .types import (
+    _ACTIVITY_CHANNELS,
+    _INSTRUMENT_TYPES,
+    _MARKET_STATUSES,
+    Activity,
+    ActivityType,
+    DealStatus,
+    Direction,
+    GetHistoryMetadata,
+    GetHistoryResponse,
+    MarketData,
+    Paging,
+    PositionData,
+    PositionDetail,
+    PositionsResponse,
+)
+
+# msgspec ignores the pydantic AfterValidators on the types.py aliases, so the
+# same value sets are mirrored here as Literals that msgspec checks natively
+InstrumentType = Literal[tuple(sorted(_INSTRUMENT_TYPES))]
+MarketStatus = Literal[tuple(sorted(_MARKET_STATUSES))]
+ActivityChannel = Literal[tuple(sorted(_ACTIVITY_CHANNELS))]
+
+
+# Positions
+class MarketDataMS(
+    msgspec.Struct,
+    rename={
+        "delay_time": "delayTime",
+        "exchange_id": "exchangeId",
+        "instrument_name": "instrumentName",
+        "instrument_type": "instrumentType",
+        "lot_size": "lotSize",
+        "market_status": "marketStatus",
+        "net_change": "netChange",
+        "percentage_change": "percentageChange",
+        "scaling_factor": "scalingFactor",
+        "streaming_prices_available": "streamingPricesAvailable",
+        "update_time": "updateTime",
+        "update_time_utc": "updateTimeUTC",
+    },
+):
+    bid: Optional[float] = None
+    delay_time: Optional[float] = None
+    epic: Optional[str] = None
+    exchange_id: Optional[str] = None
+    expiry: Optional[str] = None
+    high: Optional[float] = None
+    instrument_name: Optional[str] = None
+    instrument_type: Optional[InstrumentType] = None
+    lot_size: Optional[float] = None
+    low: Optional[float] = None
+    market_status: Optional[MarketStatus] = None
+    net_change: Optional[float] = None
+    offer: Optional[float] = None
+    percentage_change: Optional[float] = None
+    scaling_factor: Optional[float] = None
+    streaming_prices_available: Optional[bool] = None
+    update_time: Optional[str] = None
+    update_time_utc: Optional[str] = None
+
+    def to_pydantic(self) -> MarketData:
+        return MarketData.model_construct(**msgspec.structs.asdict(self))
+
+
+class PositionDetailMS(
+    msgspec.Struct,
+    rename={
+        "contract_size": "contractSize",
+        "controlled_risk": "controlledRisk",
+        "created_date": "createdDate",
+        "created_date_utc": "createdDateUTC",
+        "deal_id": "dealId",
+        "deal_reference": "dealReference",
+        "limit_level": "limitLevel",
+        "limited_risk_premium": "limitedRiskPremium",
+        "stop_level": "stopLevel",
+        "trailing_step": "trailingStep",
+        "trailing_stop_distance": "trailingStopDistance",
+    },
+):
+    contract_size: Decimal
+    controlled_risk: bool
+    created_date: str
+    created_date_utc: str
+    currency: str
+    deal_id: str
+    deal_reference: str
+    direction: Direction
+    level: Decimal
+    size: Decimal
+    limit_level: Optional[Decimal] = None
+    limited_risk_premium: Optional[Decimal] = None
+    stop_level: Optional[Decimal] = None
+    trailing_step: Optional[Decimal] = None
+    trailing_stop_distance: Optional[Decimal] = None
+
+    def to_pydantic(self) -> PositionDetail:
+        return PositionDetail.model_construct(**msgspec.structs.asdict(self))
+
+
+class PositionDataMS(msgspec.Struct):
+    market: MarketDataMS
+    position: PositionDetailMS
+
+    def to_pydantic(self) -> PositionData:
+        return PositionData.model_construct(
+            market=self.market.to_pydantic(),
+            position=self.position.to_pydantic(),
+        )
+
+
+class PositionsResponseMS(msgspec.Struct):
+    positions: List[PositionDataMS]
+
+    def to_pydantic(self) -> PositionsResponse:
+        return PositionsResponse.model_construct(
+            positions=[position.to_pydantic() for position in self.positions]
+        )
+
+
+# History
+class ActivityMS(msgspec.Struct, rename={"deal_id": "dealId"}):
+    date: datetime
+    epic: str
+    period: str
+    deal_id: str
+    channel: ActivityChannel
+    type: ActivityType
+    status: DealStatus
+    description: str
+    details: Optional[dict] = None
+
+    def to_pydantic(self) -> Activity:
+        fields = msgspec.structs.asdict(self)
+        # IG sends naive timestamps that are already in UTC; aware ones are
+        # converted rather than having their offset overwritten
+        fields["date"] = (
+            self.date.astimezone(timezone.utc)
+            if self.date.tzinfo
+            else self.date.replace(tzinfo=timezone.utc)
+        )
+        return Activity.model_construct(**fields)
+
+
+class PagingMS(msgspec.Struct):
+    size: int
+    next: Optional[str] = None
+
+    def to_pydantic(self) -> Paging:
+        return Paging(size=self.size, next=self.next)
+
+
+class GetHistoryMetadataMS(msgspec.Struct):
+    paging: PagingMS
+
+    def to_pydantic(self) -> GetHistoryMetadata:
+        return GetHistoryMetadata.model_construct(paging=self.paging.to_pydantic())
+
+
+class GetHistoryResponseMS(msgspec.Struct):
+    activities: List[ActivityMS]
+    metadata: GetHistoryMetadataMS
+
+    def to_pydantic(self) -> GetHistoryResponse:
+        return GetHistoryResponse.model_construct(
+            activities=[activity.to_pydantic() for activity in self.activities],
+            metadata=self.metadata.to_pydantic(),
+        )
+
+
+POSITIONS_DECODER = msgspec.json.Decoder(PositionsResponseMS)
+HISTORY_DECODER = msgspec.json.Decoder(GetHistoryResponseMS)
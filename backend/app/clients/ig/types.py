@@ -1,44 +1,73 @@
 from decimal import Decimal
-from typing import List, Literal, Optional
+from enum import Enum
+from typing import Annotated, Final, List, Literal, Optional, TypedDict
 from datetime import datetime, timezone
-from pydantic import AwareDatetime, NaiveDatetime, BaseModel, Field, field_validator
+from pydantic import (
+    AfterValidator,
+    AwareDatetime,
+    NaiveDatetime,
+    BaseModel,
+    ConfigDict,
+    Field,
+    TypeAdapter,
+    field_validator,
+)
+from pydantic.dataclasses import dataclass
+
 
 # Core Type Definitions
-type InstrumentType = Literal[
-    "BINARY",
-    "BUNGEE_CAPPED",
-    "BUNGEE_COMMODITIES",
-    "BUNGEE_CURRENCIES",
-    "BUNGEE_INDICES",
-    "COMMODITIES",
-    "CURRENCIES",
-    "INDICES",
-    "KNOCKOUTS_COMMODITIES",
-    "KNOCKOUTS_CURRENCIES",
-    "KNOCKOUTS_INDICES",
-    "KNOCKOUTS_SHARES",
-    "OPT_COMMODITIES",
-    "OPT_CURRENCIES",
-    "OPT_INDICES",
-    "OPT_RATES",
-    "OPT_SHARES",
-    "RATES",
-    "SECTORS",
-    "SHARES",
-    "SPRINT_MARKET",
-    "TEST_MARKET",
-    "UNKNOWN",
-]
-
-type MarketStatus = Literal[
-    "CLOSED",
-    "EDITS_ONLY",
-    "OFFLINE",
-    "ON_AUCTION",
-    "ON_AUCTION_NO_EDITS",
-    "SUSPENDED",
-    "TRADEABLE",
-]
+# Large value sets are checked with a single frozenset lookup rather than a
+# Literal union, which compiles to one schema branch per value
+def _one_of(allowed: frozenset[str]) -> AfterValidator:
+    def check(value: str) -> str:
+        if value not in allowed:
+            raise ValueError(f"Unexpected value {value!r}")
+        return value
+
+    return AfterValidator(check)
+
+
+_INSTRUMENT_TYPES: Final[frozenset[str]] = frozenset(
+    {
+        "BINARY",
+        "BUNGEE_CAPPED",
+        "BUNGEE_COMMODITIES",
+        "BUNGEE_CURRENCIES",
+        "BUNGEE_INDICES",
+        "COMMODITIES",
+        "CURRENCIES",
+        "INDICES",
+        "KNOCKOUTS_COMMODITIES",
+        "KNOCKOUTS_CURRENCIES",
+        "KNOCKOUTS_INDICES",
+        "KNOCKOUTS_SHARES",
+        "OPT_COMMODITIES",
+        "OPT_CURRENCIES",
+        "OPT_INDICES",
+        "OPT_RATES",
+        "OPT_SHARES",
+        "RATES",
+        "SECTORS",
+        "SHARES",
+        "SPRINT_MARKET",
+        "TEST_MARKET",
+        "UNKNOWN",
+    }
+)
+type InstrumentType = Annotated[str, _one_of(_INSTRUMENT_TYPES)]
+
+_MARKET_STATUSES: Final[frozenset[str]] = frozenset(
+    {
+        "CLOSED",
+        "EDITS_ONLY",
+        "OFFLINE",
+        "ON_AUCTION",
+        "ON_AUCTION_NO_EDITS",
+        "SUSPENDED",
+        "TRADEABLE",
+    }
+)
+type MarketStatus = Annotated[str, _one_of(_MARKET_STATUSES)]
 
 type Direction = Literal["BUY", "SELL"]
 
@@ -54,125 +83,175 @@ type AccountStatus = Literal["DISABLED", "ENABLED", "SUSPENDED_FROM_DEALING"]
 
 type AccountType = Literal["CFD", "PHYSICAL", "SPREADBET"]
 
-type ActivityChannel = Literal[
-    "DEALER", "MOBILE", "PUBLIC_FIX_API", "PUBLIC_WEB_API", "SYSTEM", "WEB"
-]
-
-type ActivityActionType = Literal[
-    "LIMIT_ORDER_AMENDED",
-    "LIMIT_ORDER_DELETED",
-    "LIMIT_ORDER_FILLED",
-    "LIMIT_ORDER_OPENED",
-    "LIMIT_ORDER_ROLLED",
-    "POSITION_CLOSED",
-    "POSITION_DELETED",
-    "POSITION_OPENED",
-    "POSITION_PARTIALLY_CLOSED",
-    "POSITION_ROLLED",
-    "STOP_LIMIT_AMENDED",
-    "STOP_ORDER_AMENDED",
-    "STOP_ORDER_DELETED",
-    "STOP_ORDER_FILLED",
-    "STOP_ORDER_OPENED",
-    "STOP_ORDER_ROLLED",
-    "UNKNOWN",
-    "WORKING_ORDER_DELETED",
-]
-
-type AffectedDealStatus = Literal[
-    "AMENDED", "DELETED", "FULLY_CLOSED", "OPENED", "PARTIALLY_CLOSED"
-]
+_ACTIVITY_CHANNELS: Final[frozenset[str]] = frozenset(
+    {
+        "DEALER",
+        "MOBILE",
+        "PUBLIC_FIX_API",
+        "PUBLIC_WEB_API",
+        "SYSTEM",
+        "WEB",
+    }
+)
+type ActivityChannel = Annotated[str, _one_of(_ACTIVITY_CHANNELS)]
+
+_ACTIVITY_ACTION_TYPES: Final[frozenset[str]] = frozenset(
+    {
+        "LIMIT_ORDER_AMENDED",
+        "LIMIT_ORDER_DELETED",
+        "LIMIT_ORDER_FILLED",
+        "LIMIT_ORDER_OPENED",
+        "LIMIT_ORDER_ROLLED",
+        "POSITION_CLOSED",
+        "POSITION_DELETED",
+        "POSITION_OPENED",
+        "POSITION_PARTIALLY_CLOSED",
+        "POSITION_ROLLED",
+        "STOP_LIMIT_AMENDED",
+        "STOP_ORDER_AMENDED",
+        "STOP_ORDER_DELETED",
+        "STOP_ORDER_FILLED",
+        "STOP_ORDER_OPENED",
+        "STOP_ORDER_ROLLED",
+        "UNKNOWN",
+        "WORKING_ORDER_DELETED",
+    }
+)
+type ActivityActionType = Annotated[str, _one_of(_ACTIVITY_ACTION_TYPES)]
+
+_AFFECTED_DEAL_STATUSES: Final[frozenset[str]] = frozenset(
+    {
+        "AMENDED",
+        "DELETED",
+        "FULLY_CLOSED",
+        "OPENED",
+        "PARTIALLY_CLOSED",
+    }
+)
+type AffectedDealStatus = Annotated[str, _one_of(_AFFECTED_DEAL_STATUSES)]
 
 type DealStatus = Literal["ACCEPTED", "REJECTED"]
 
-type PositionStatus = Literal[
-    "AMENDED", "CLOSED", "DELETED", "OPEN", "PARTIALLY_CLOSED"
-]
+_POSITION_STATUSES: Final[frozenset[str]] = frozenset(
+    {
+        "AMENDED",
+        "CLOSED",
+        "DELETED",
+        "OPEN",
+        "PARTIALLY_CLOSED",
+    }
+)
+type PositionStatus = Annotated[str, _one_of(_POSITION_STATUSES)]
 
 type ActivityType = Literal["POSITION", "WORKING_ORDER", "SYSTEM"]
 
-type Resolution = Literal[
-    "DAY",
-    "HOUR",
-    "HOUR_2",
-    "HOUR_3",
-    "HOUR_4",
-    "MINUTE",
-    "MINUTE_10",
-    "MINUTE_15",
-    "MINUTE_2",
-    "MINUTE_3",
-    "MINUTE_30",
-    "MINUTE_5",
-    "MONTH",
-    "SECOND",
-    "WEEK",
-]
-
-type ReasonCode = Literal[
-    "ACCOUNT_NOT_ENABLED_TO_TRADING",
-    "ATTACHED_ORDER_LEVEL_ERROR",
-    "ATTACHED_ORDER_TRAILING_STOP_ERROR",
-    "CANNOT_CHANGE_STOP_TYPE",
-    "CANNOT_REMOVE_STOP",
-    "CLOSING_ONLY_TRADES_ACCEPTED_ON_THIS_MARKET",
-    "CLOSINGS_ONLY_ACCOUNT",
-    "CONFLICTING_ORDER",
-    "CONTACT_SUPPORT_INSTRUMENT_ERROR",
-    "CR_SPACING",
-    "DUPLICATE_ORDER_ERROR",
-    "EXCHANGE_MANUAL_OVERRIDE",
-    "EXPIRY_LESS_THAN_SPRINT_MARKET_MIN_EXPIRY",
-    "FINANCE_REPEAT_DEALING",
-    "FORCE_OPEN_ON_SAME_MARKET_DIFFERENT_CURRENCY",
-    "GENERAL_ERROR",
-    "GOOD_TILL_DATE_IN_THE_PAST",
-    "INSTRUMENT_NOT_FOUND",
-    "INSTRUMENT_NOT_TRADEABLE_IN_THIS_CURRENCY",
-    "INSUFFICIENT_FUNDS",
-    "LEVEL_TOLERANCE_ERROR",
-    "LIMIT_ORDER_WRONG_SIDE_OF_MARKET",
-    "MANUAL_ORDER_TIMEOUT",
-    "MARGIN_ERROR",
-    "MARKET_CLOSED",
-    "MARKET_CLOSED_WITH_EDITS",
-    "MARKET_CLOSING",
-    "MARKET_NOT_BORROWABLE",
-    "MARKET_OFFLINE",
-    "MARKET_ORDERS_NOT_ALLOWED_ON_INSTRUMENT",
-    "MARKET_PHONE_ONLY",
-    "MARKET_ROLLED",
-    "MARKET_UNAVAILABLE_TO_CLIENT",
-    "MAX_AUTO_SIZE_EXCEEDED",
-    "MINIMUM_ORDER_SIZE_ERROR",
-    "MOVE_AWAY_ONLY_LIMIT",
-    "MOVE_AWAY_ONLY_STOP",
-    "MOVE_AWAY_ONLY_TRIGGER_LEVEL",
-    "NCR_POSITIONS_ON_CR_ACCOUNT",
-    "OPPOSING_DIRECTION_ORDERS_NOT_ALLOWED",
-    "OPPOSING_POSITIONS_NOT_ALLOWED",
-    "ORDER_DECLINED",
-    "ORDER_LOCKED",
-    "ORDER_NOT_FOUND",
-    "ORDER_SIZE_CANNOT_BE_FILLED",
-    "OVER_NORMAL_MARKET_SIZE",
-    "PARTIALY_CLOSED_POSITION_NOT_DELETED",
-    "POSITION_ALREADY_EXISTS_IN_OPPOSITE_DIRECTION",
-    "POSITION_NOT_AVAILABLE_TO_CANCEL",
-    "POSITION_NOT_AVAILABLE_TO_CLOSE",
-    "POSITION_NOT_FOUND",
-    "REJECT_CFD_ORDER_ON_SPREADBET_ACCOUNT",
-    "REJECT_SPREADBET_ORDER_ON_CFD_ACCOUNT",
-    "SIZE_INCREMENT",
-    "SPRINT_MARKET_EXPIRY_AFTER_MARKET_CLOSE",
-    "STOP_OR_LIMIT_NOT_ALLOWED",
-    "STOP_REQUIRED_ERROR",
-    "STRIKE_LEVEL_TOLERANCE",
-    "SUCCESS",
-    "TRAILING_STOP_NOT_ALLOWED",
-    "UNKNOWN",
-    "WRONG_SIDE_OF_MARKET",
-]
+_RESOLUTIONS: Final[frozenset[str]] = frozenset(
+    {
+        "DAY",
+        "HOUR",
+        "HOUR_2",
+        "HOUR_3",
+        "HOUR_4",
+        "MINUTE",
+        "MINUTE_10",
+        "MINUTE_15",
+        "MINUTE_2",
+        "MINUTE_3",
+        "MINUTE_30",
+        "MINUTE_5",
+        "MONTH",
+        "SECOND",
+        "WEEK",
+    }
+)
+type Resolution = Annotated[str, _one_of(_RESOLUTIONS)]
+
+
+class ReasonCode(str, Enum):
+    """
+    Describes the error (or success) condition for a trading operation.
+
+    Validated as an enum so a reason resolves with one dict lookup instead of
+    a linear scan across every member. Codes IG adds later map to UNKNOWN
+    rather than failing the whole confirmation.
+    """
+
+    ACCOUNT_NOT_ENABLED_TO_TRADING = "ACCOUNT_NOT_ENABLED_TO_TRADING"
+    ATTACHED_ORDER_LEVEL_ERROR = "ATTACHED_ORDER_LEVEL_ERROR"
+    ATTACHED_ORDER_TRAILING_STOP_ERROR = "ATTACHED_ORDER_TRAILING_STOP_ERROR"
+    CANNOT_CHANGE_STOP_TYPE = "CANNOT_CHANGE_STOP_TYPE"
+    CANNOT_REMOVE_STOP = "CANNOT_REMOVE_STOP"
+    CLOSING_ONLY_TRADES_ACCEPTED_ON_THIS_MARKET = (
+        "CLOSING_ONLY_TRADES_ACCEPTED_ON_THIS_MARKET"
+    )
+    CLOSINGS_ONLY_ACCOUNT = "CLOSINGS_ONLY_ACCOUNT"
+    CONFLICTING_ORDER = "CONFLICTING_ORDER"
+    CONTACT_SUPPORT_INSTRUMENT_ERROR = "CONTACT_SUPPORT_INSTRUMENT_ERROR"
+    CR_SPACING = "CR_SPACING"
+    DUPLICATE_ORDER_ERROR = "DUPLICATE_ORDER_ERROR"
+    EXCHANGE_MANUAL_OVERRIDE = "EXCHANGE_MANUAL_OVERRIDE"
+    EXPIRY_LESS_THAN_SPRINT_MARKET_MIN_EXPIRY = (
+        "EXPIRY_LESS_THAN_SPRINT_MARKET_MIN_EXPIRY"
+    )
+    FINANCE_REPEAT_DEALING = "FINANCE_REPEAT_DEALING"
+    FORCE_OPEN_ON_SAME_MARKET_DIFFERENT_CURRENCY = (
+        "FORCE_OPEN_ON_SAME_MARKET_DIFFERENT_CURRENCY"
+    )
+    GENERAL_ERROR = "GENERAL_ERROR"
+    GOOD_TILL_DATE_IN_THE_PAST = "GOOD_TILL_DATE_IN_THE_PAST"
+    INSTRUMENT_NOT_FOUND = "INSTRUMENT_NOT_FOUND"
+    INSTRUMENT_NOT_TRADEABLE_IN_THIS_CURRENCY = (
+        "INSTRUMENT_NOT_TRADEABLE_IN_THIS_CURRENCY"
+    )
+    INSUFFICIENT_FUNDS = "INSUFFICIENT_FUNDS"
+    LEVEL_TOLERANCE_ERROR = "LEVEL_TOLERANCE_ERROR"
+    LIMIT_ORDER_WRONG_SIDE_OF_MARKET = "LIMIT_ORDER_WRONG_SIDE_OF_MARKET"
+    MANUAL_ORDER_TIMEOUT = "MANUAL_ORDER_TIMEOUT"
+    MARGIN_ERROR = "MARGIN_ERROR"
+    MARKET_CLOSED = "MARKET_CLOSED"
+    MARKET_CLOSED_WITH_EDITS = "MARKET_CLOSED_WITH_EDITS"
+    MARKET_CLOSING = "MARKET_CLOSING"
+    MARKET_NOT_BORROWABLE = "MARKET_NOT_BORROWABLE"
+    MARKET_OFFLINE = "MARKET_OFFLINE"
+    MARKET_ORDERS_NOT_ALLOWED_ON_INSTRUMENT = "MARKET_ORDERS_NOT_ALLOWED_ON_INSTRUMENT"
+    MARKET_PHONE_ONLY = "MARKET_PHONE_ONLY"
+    MARKET_ROLLED = "MARKET_ROLLED"
+    MARKET_UNAVAILABLE_TO_CLIENT = "MARKET_UNAVAILABLE_TO_CLIENT"
+    MAX_AUTO_SIZE_EXCEEDED = "MAX_AUTO_SIZE_EXCEEDED"
+    MINIMUM_ORDER_SIZE_ERROR = "MINIMUM_ORDER_SIZE_ERROR"
+    MOVE_AWAY_ONLY_LIMIT = "MOVE_AWAY_ONLY_LIMIT"
+    MOVE_AWAY_ONLY_STOP = "MOVE_AWAY_ONLY_STOP"
+    MOVE_AWAY_ONLY_TRIGGER_LEVEL = "MOVE_AWAY_ONLY_TRIGGER_LEVEL"
+    NCR_POSITIONS_ON_CR_ACCOUNT = "NCR_POSITIONS_ON_CR_ACCOUNT"
+    OPPOSING_DIRECTION_ORDERS_NOT_ALLOWED = "OPPOSING_DIRECTION_ORDERS_NOT_ALLOWED"
+    OPPOSING_POSITIONS_NOT_ALLOWED = "OPPOSING_POSITIONS_NOT_ALLOWED"
+    ORDER_DECLINED = "ORDER_DECLINED"
+    ORDER_LOCKED = "ORDER_LOCKED"
+    ORDER_NOT_FOUND = "ORDER_NOT_FOUND"
+    ORDER_SIZE_CANNOT_BE_FILLED = "ORDER_SIZE_CANNOT_BE_FILLED"
+    OVER_NORMAL_MARKET_SIZE = "OVER_NORMAL_MARKET_SIZE"
+    PARTIALY_CLOSED_POSITION_NOT_DELETED = "PARTIALY_CLOSED_POSITION_NOT_DELETED"
+    POSITION_ALREADY_EXISTS_IN_OPPOSITE_DIRECTION = (
+        "POSITION_ALREADY_EXISTS_IN_OPPOSITE_DIRECTION"
+    )
+    POSITION_NOT_AVAILABLE_TO_CANCEL = "POSITION_NOT_AVAILABLE_TO_CANCEL"
+    POSITION_NOT_AVAILABLE_TO_CLOSE = "POSITION_NOT_AVAILABLE_TO_CLOSE"
+    POSITION_NOT_FOUND = "POSITION_NOT_FOUND"
+    REJECT_CFD_ORDER_ON_SPREADBET_ACCOUNT = "REJECT_CFD_ORDER_ON_SPREADBET_ACCOUNT"
+    REJECT_SPREADBET_ORDER_ON_CFD_ACCOUNT = "REJECT_SPREADBET_ORDER_ON_CFD_ACCOUNT"
+    SIZE_INCREMENT = "SIZE_INCREMENT"
+    SPRINT_MARKET_EXPIRY_AFTER_MARKET_CLOSE = "SPRINT_MARKET_EXPIRY_AFTER_MARKET_CLOSE"
+    STOP_OR_LIMIT_NOT_ALLOWED = "STOP_OR_LIMIT_NOT_ALLOWED"
+    STOP_REQUIRED_ERROR = "STOP_REQUIRED_ERROR"
+    STRIKE_LEVEL_TOLERANCE = "STRIKE_LEVEL_TOLERANCE"
+    SUCCESS = "SUCCESS"
+    TRAILING_STOP_NOT_ALLOWED = "TRAILING_STOP_NOT_ALLOWED"
+    UNKNOWN = "UNKNOWN"
+    WRONG_SIDE_OF_MARKET = "WRONG_SIDE_OF_MARKET"
+
+    @classmethod
+    def _missing_(cls, value: object) -> "ReasonCode":
+        return cls.UNKNOWN
 
 
 # Error Response Model
@@ -185,6 +264,8 @@ class ErrorResponse(BaseModel):
 
 # Account Models
 class AccountBalance(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     available: Decimal = Field(..., description="Available balance for trading")
     balance: Decimal = Field(..., description="Total balance in the account")
     deposit: Decimal = Field(..., description="Deposit amount in the account")
@@ -227,6 +308,8 @@ class Account(BaseModel):
 
 # Authentication Models
 class OauthToken(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     access_token: str = Field(..., description="Access token for authentication")
     refresh_token: str = Field(..., description="Refresh token for renewing access")
     scope: str = Field(..., description="Scope of the access token")
@@ -254,6 +337,8 @@ class AuthenticationData(BaseModel):
 
 # Activity and History Models
 class ActivityAction(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     action_type: ActivityActionType = Field(
         ..., description="Type of the activity action", alias="actionType"
     )
@@ -306,7 +391,8 @@ class GetHistoryFilters(BaseModel):
         populate_by_name = True
 
 
-class Paging(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class Paging:
     next: Optional[str] = Field(None, description="Token for the next page of results")
     size: int = Field(..., description="Number of records per page")
 
@@ -328,23 +414,28 @@ class GetHistoryResponse(BaseModel):
 
 # Market Data Models (Unified)
 class MarketData(BaseModel):
-    """Unified market data model used across positions and working orders"""
+    """
+    Unified market data model used across positions and working orders.
 
-    bid: Optional[Decimal] = None
-    delay_time: Optional[Decimal] = Field(None, alias="delayTime")
+    Prices here are read-only display values, so they are parsed as floats.
+    Keep Decimal for fields that feed order construction.
+    """
+
+    bid: Optional[float] = None
+    delay_time: Optional[float] = Field(None, alias="delayTime")
     epic: Optional[str] = None
     exchange_id: Optional[str] = Field(None, alias="exchangeId")
     expiry: Optional[str] = None
-    high: Optional[Decimal] = None
+    high: Optional[float] = None
     instrument_name: Optional[str] = Field(None, alias="instrumentName")
     instrument_type: Optional[InstrumentType] = Field(None, alias="instrumentType")
-    lot_size: Optional[Decimal] = Field(None, alias="lotSize")
-    low: Optional[Decimal] = None
+    lot_size: Optional[float] = Field(None, alias="lotSize")
+    low: Optional[float] = None
     market_status: Optional[MarketStatus] = Field(None, alias="marketStatus")
-    net_change: Optional[Decimal] = Field(None, alias="netChange")
-    offer: Optional[Decimal] = None
-    percentage_change: Optional[Decimal] = Field(None, alias="percentageChange")
-    scaling_factor: Optional[Decimal] = Field(None, alias="scalingFactor")
+    net_change: Optional[float] = Field(None, alias="netChange")
+    offer: Optional[float] = None
+    percentage_change: Optional[float] = Field(None, alias="percentageChange")
+    scaling_factor: Optional[float] = Field(None, alias="scalingFactor")
     streaming_prices_available: Optional[bool] = Field(
         None, alias="streamingPricesAvailable"
     )
@@ -444,6 +535,101 @@ class WorkingOrdersResponse(BaseModel):
     working_orders: List[WorkingOrderData] = Field(alias="workingOrders")
 
 
+# Lightweight TypedDict variants of the position and working order models.
+# These keep IG's camelCase keys and skip building nested BaseModel instances,
+# so they're meant for internal read-only checks over the full list; use the
+# BaseModel classes above anywhere the data crosses the API boundary.
+class MarketDataTD(TypedDict, total=False):
+    bid: Optional[float]
+    delayTime: Optional[float]
+    epic: Optional[str]
+    exchangeId: Optional[str]
+    expiry: Optional[str]
+    high: Optional[float]
+    instrumentName: Optional[str]
+    instrumentType: Optional[InstrumentType]
+    lotSize: Optional[float]
+    low: Optional[float]
+    marketStatus: Optional[MarketStatus]
+    netChange: Optional[float]
+    offer: Optional[float]
+    percentageChange: Optional[float]
+    scalingFactor: Optional[float]
+    streamingPricesAvailable: Optional[bool]
+    updateTime: Optional[str]
+    updateTimeUTC: Optional[str]
+
+
+class PositionDetailTD(TypedDict, total=False):
+    contractSize: Decimal
+    controlledRisk: bool
+    createdDate: str
+    createdDateUTC: str
+    currency: str
+    dealId: str
+    dealReference: str
+    direction: Direction
+    level: Decimal
+    limitLevel: Optional[Decimal]
+    limitedRiskPremium: Optional[Decimal]
+    size: Decimal
+    stopLevel: Optional[Decimal]
+    trailingStep: Optional[Decimal]
+    trailingStopDistance: Optional[Decimal]
+
+
+class PositionDataTD(TypedDict):
+    market: MarketDataTD
+    position: PositionDetailTD
+
+
+class PositionsResponseTD(TypedDict):
+    positions: List[PositionDataTD]
+
+
+class WorkingOrderDetailTD(TypedDict, total=False):
+    createdDate: Optional[str]
+    createdDateUTC: Optional[NaiveDatetime]
+    currencyCode: Optional[str]
+    dealId: Optional[str]
+    direction: Optional[Direction]
+    dma: Optional[bool]
+    epic: Optional[str]
+    goodTillDate: Optional[str]
+    goodTillDateISO: Optional[str]
+    guaranteedStop: Optional[bool]
+    limitDistance: Optional[Decimal]
+    limitedRiskPremium: Optional[Decimal]
+    orderLevel: Optional[Decimal]
+    orderSize: Optional[Decimal]
+    orderType: Optional[OrderType]
+    stopDistance: Optional[Decimal]
+    timeInForce: Optional[TimeInForce]
+
+
+class WorkingOrderDataTD(TypedDict, total=False):
+    marketData: Optional[MarketDataTD]
+    workingOrderData: Optional[WorkingOrderDetailTD]
+
+
+class WorkingOrdersResponseTD(TypedDict):
+    workingOrders: List[WorkingOrderDataTD]
+
+
+POSITIONS_TD_ADAPTER = TypeAdapter(PositionsResponseTD)
+WORKING_ORDERS_TD_ADAPTER = TypeAdapter(WorkingOrdersResponseTD)
+
+
+def parse_positions_fast(payload: bytes) -> List[PositionDataTD]:
+    """Parse a raw /positions response body into lightweight TypedDicts."""
+    return POSITIONS_TD_ADAPTER.validate_json(payload)["positions"]
+
+
+def parse_working_orders_fast(payload: bytes) -> List[WorkingOrderDataTD]:
+    """Parse a raw /workingorders response body into lightweight TypedDicts."""
+    return WORKING_ORDERS_TD_ADAPTER.validate_json(payload)["workingOrders"]
+
+
 # Request Models for Creating Orders and Positions
 class CreateWorkingOrderRequest(BaseModel):
     """Request to create a working order"""
@@ -530,7 +716,8 @@ class GetPositionByDealIdRequest(BaseModel):
         populate_by_name = True
 
 
-class AffectedDeal(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class AffectedDeal:
     """Information about a deal affected by a transaction"""
 
     deal_id: str = Field(..., alias="dealId", description="Deal identifier")
@@ -582,8 +769,7 @@ class DealConfirmation(BaseModel):
         ..., alias="trailingStop", description="True if trailing stop"
     )
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True, use_enum_values=True)
 
 
 class DeleteWorkingOrderRequest(BaseModel):
@@ -745,3 +931,9 @@ class GetPricesRequest(BaseModel):
         20, description="Page size (disable paging = 0)", alias="pageSize"
     )
     page_number: int = Field(1, description="Page number", alias="pageNumber")
+
+
+# Module-level adapter for the working orders response, so the raw response
+# bytes can be validated directly by pydantic-core without an intermediate dict.
+# Positions and history are decoded with msgspec instead (see structs.py).
+ORDERS_ADAPTER = TypeAdapter(WorkingOrdersResponse)
@@ -1,14 +1,140 @@
+import json
 import logging
-from datetime import datetime
-from typing import Optional
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import islice
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
-import yfinance as yf
-from pandas import Timestamp
+from app.config import settings
+from redis import Redis, RedisError
 
 from .types import DividendInfo, StockInfo
 
+if TYPE_CHECKING:
+    # yfinance pulls in pandas, numpy, requests and friends, which adds
+    # noticeably to startup time; they're imported where they're used instead
+    import yfinance as yf
+    from curl_cffi import requests as curl_requests
+
 logger = logging.getLogger(__name__)
 
+# yfinance memoizes `.info` on each Ticker instance, so cached
+# tickers are bucketed by time to stop long-running workers serving stale data.
+TICKER_CACHE_TTL_SECONDS = 300
+TICKER_CACHE_MAX_SIZE = 512
+DIVIDEND_DATES_MAX_WORKERS = 8
+
+# `.info` is a slow scrape and barely changes minute to minute, so it's shared
+# across workers through Redis. If Redis is down we fall back to the ticker's
+# own in-process memo above.
+INFO_CACHE_TTL_SECONDS = 300
+INFO_CACHE_KEY_PREFIX = "yfinfo:"
+
+# Dividend dates are announced weeks ahead and only move quarterly, so the
+# resolved next date is kept for a day and checked before touching Yahoo at all
+NEXT_DIVIDEND_CACHE_TTL_SECONDS = 60 * 60 * 24
+NEXT_DIVIDEND_CACHE_KEY_PREFIX = "yfnextdiv:"
+
+# Yahoo's multi-symbol quote endpoint, used to refresh many symbols per request
+QUOTE_URL = "https://query1.finance.yahoo.com/v7/finance/quote"
+QUOTE_BATCH_SIZE = 10
+QUOTE_TIMEOUT_SECONDS = 5
+
+
+@lru_cache(maxsize=1)
+def _get_session() -> "curl_requests.Session":
+    """
+    One HTTP session shared by every Ticker, so connections, cookies and the
+    crumb are reused. yfinance only accepts curl_cffi sessions, not requests.
+    """
+    from curl_cffi import requests as curl_requests
+
+    return curl_requests.Session(impersonate="chrome")
+
+
+@lru_cache(maxsize=TICKER_CACHE_MAX_SIZE)
+def _get_cached_ticker(symbol: str, ttl_bucket: int) -> "yf.Ticker":
+    import yfinance as yf
+
+    return yf.Ticker(symbol, session=_get_session())
+
+
+@lru_cache(maxsize=1)
+def _get_redis() -> Redis:
+    return Redis.from_url(settings.REDIS_URL, socket_timeout=5)
+
+
+def _cache_get(key: str) -> Optional[bytes]:
+    """Read a cached value, treating an unavailable Redis as a miss."""
+    try:
+        return _get_redis().get(key)
+    except RedisError as e:
+        logger.warning("Yahoo cache unavailable: %s", e)
+        return None
+
+
+def _cache_set(key: str, ttl: int, value: str) -> None:
+    try:
+        _get_redis().setex(key, ttl, value)
+    except RedisError as e:
+        logger.warning("Failed to cache Yahoo data under %s: %s", key, e)
+
+
+def _to_datetime(value) -> Optional[datetime]:
+    """Convert a Yahoo date (epoch seconds, ISO string or Timestamp) to a datetime."""
+    if not value:
+        return None
+
+    # Exact type checks; Yahoo only hands back these concrete types
+    value_type = type(value)
+    if value_type is int or value_type is float:
+        return datetime.fromtimestamp(value, tz=timezone.utc)
+    if value_type is datetime:
+        return value
+    if value_type is str:
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            return None
+
+    from pandas import Timestamp
+
+    if value_type is Timestamp:
+        return value.to_pydatetime()
+    return None
+
+
+def _epochs_to_datetimes(values: List) -> List[Optional[datetime]]:
+    """
+    Convert many Yahoo epoch-second dates in one vectorised pandas call.
+
+    Results are aware UTC datetimes, matching `_to_datetime`, so a date is the
+    same whichever path resolved it. Anything that isn't a plain number goes
+    through `_to_datetime`.
+    """
+    import numpy as np
+    from pandas import to_datetime
+
+    converted: List[Optional[datetime]] = [None] * len(values)
+    epoch_positions: List[int] = []
+    for i, value in enumerate(values):
+        value_type = type(value)
+        if value_type is int or value_type is float:
+            if value:
+                epoch_positions.append(i)
+        else:
+            converted[i] = _to_datetime(value)
+
+    if epoch_positions:
+        epochs = np.array([values[i] for i in epoch_positions], dtype="float64")
+        timestamps = to_datetime(epochs, unit="s", utc=True).to_pydatetime()
+        for i, timestamp in zip(epoch_positions, timestamps):
+            converted[i] = timestamp
+
+    return converted
+
 
 class YahooFinanceClient:
     """Client for Yahoo Finance API using yfinance library."""
@@ -17,6 +143,34 @@ class YahooFinanceClient:
         """Initialize the Yahoo Finance client."""
         pass
 
+    @staticmethod
+    def _get_ticker(symbol: str) -> "yf.Ticker":
+        """Return a shared Ticker for the symbol, refreshed every TTL window."""
+        ttl_bucket = int(time.monotonic() // TICKER_CACHE_TTL_SECONDS)
+        return _get_cached_ticker(symbol, ttl_bucket)
+
+    def _fetch_info(self, symbol: str) -> dict:
+        """Return `ticker.info` for the symbol, served from Redis when cached."""
+        key = f"{INFO_CACHE_KEY_PREFIX}{symbol}"
+        cached = _cache_get(key)
+        if cached is not None:
+            return json.loads(cached)
+
+        info = self._get_ticker(symbol).info
+        _cache_set(key, INFO_CACHE_TTL_SECONDS, json.dumps(info, default=str))
+        return info
+
+    @staticmethod
+    def _extract_dividend_dates(
+        info: dict,
+    ) -> Tuple[Optional[datetime], Optional[datetime], Optional[datetime]]:
+        """Return (next dividend, ex-dividend, pay) dates from ticker info."""
+        ex_dividend_date = _to_datetime(info.get("exDividendDate"))
+        pay_date = _to_datetime(info.get("payoutDate"))
+
+        # Non-payers have no exDividendDate, so it doubles as the "next" date
+        return ex_dividend_date, ex_dividend_date, pay_date
+
     def get_next_dividend_date(self, symbol: str) -> Optional[datetime]:
         """
         Get the next dividend date for a given ticker symbol.
@@ -30,40 +184,97 @@ class YahooFinanceClient:
         Raises:
             ValueError: If the symbol is invalid or not found
         """
-        try:
-            logger.debug(f"Fetching dividend date for symbol: {symbol}")
+        key = f"{NEXT_DIVIDEND_CACHE_KEY_PREFIX}{symbol}"
+        cached = _cache_get(key)
+        if cached is not None:
+            # Non-payers are cached too, as an empty string
+            return datetime.fromisoformat(cached.decode()) if cached else None
 
-            # Create ticker object
-            ticker = yf.Ticker(symbol)
-
-            # Get dividend data
-            dividends = ticker.dividends
+        try:
+            logger.debug("Fetching dividend date for symbol: %s", symbol)
 
-            if dividends.empty:
-                logger.info(f"No dividend data found for symbol: {symbol}")
-                return None
+            info = self._fetch_info(symbol)
+            next_dividend_date, _, _ = self._extract_dividend_dates(info)
+            if next_dividend_date is None:
+                logger.info("No dividend data found for symbol: %s", symbol)
 
-            dividends.index[-1]
+        except Exception as e:
+            logger.error(f"Error fetching dividend date for {symbol}: {str(e)}")
+            raise ValueError(
+                f"Failed to get dividend data for symbol {symbol}: {str(e)}"
+            )
 
-            info = ticker.info
+        _cache_set(
+            key,
+            NEXT_DIVIDEND_CACHE_TTL_SECONDS,
+            next_dividend_date.isoformat() if next_dividend_date else "",
+        )
+        return next_dividend_date
 
-            next_dividend_date = None
+    def get_next_dividend_dates(
+        self, symbols: List[str], max_workers: int = DIVIDEND_DATES_MAX_WORKERS
+    ) -> Dict[str, Optional[datetime]]:
+        """
+        Get the next dividend dates for several symbols.
 
-            if "exDividendDate" in info and info["exDividendDate"]:
-                ex_div_timestamp = info["exDividendDate"]
-                if isinstance(ex_div_timestamp, (int, float)):
-                    next_dividend_date = datetime.fromtimestamp(ex_div_timestamp)
-                elif isinstance(ex_div_timestamp, Timestamp):
-                    next_dividend_date = ex_div_timestamp.to_pydatetime()
+        Cached dates are used first; the rest are fetched in batches through
+        `get_dividend_info_many`. Symbols the quote endpoint doesn't return
+        fall back to a per-symbol lookup in a thread pool.
 
-            return next_dividend_date
+        Args:
+            symbols: The ticker symbols (e.g., ['AAPL', 'MSFT'])
+            max_workers: Maximum number of concurrent per-symbol fallbacks
 
-        except Exception as e:
-            logger.error(f"Error fetching dividend date for {symbol}: {str(e)}")
-            raise ValueError(
-                f"Failed to get dividend data for symbol {symbol}: {str(e)}"
+        Returns:
+            Mapping of symbol to its next dividend date. Symbols that fail to
+            resolve are logged and mapped to None.
+        """
+        dividend_dates: Dict[str, Optional[datetime]] = {}
+        missing: List[str] = []
+        for symbol in dict.fromkeys(symbols):
+            cached = _cache_get(f"{NEXT_DIVIDEND_CACHE_KEY_PREFIX}{symbol}")
+            if cached is None:
+                missing.append(symbol)
+            else:
+                # Non-payers are cached too, as an empty string
+                dividend_dates[symbol] = (
+                    datetime.fromisoformat(cached.decode()) if cached else None
+                )
+
+        if not missing:
+            return dividend_dates
+
+        for symbol, info in self.get_dividend_info_many(missing).items():
+            next_dividend_date = info.next_dividend_date
+            dividend_dates[symbol] = next_dividend_date
+            _cache_set(
+                f"{NEXT_DIVIDEND_CACHE_KEY_PREFIX}{symbol}",
+                NEXT_DIVIDEND_CACHE_TTL_SECONDS,
+                next_dividend_date.isoformat() if next_dividend_date else "",
             )
 
+        unresolved = [symbol for symbol in missing if symbol not in dividend_dates]
+        if not unresolved:
+            return dividend_dates
+
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(unresolved)),
+            thread_name_prefix="yahoo-dividends",
+        ) as executor:
+            futures = {
+                executor.submit(self.get_next_dividend_date, symbol): symbol
+                for symbol in unresolved
+            }
+            for future in as_completed(futures):
+                symbol = futures[future]
+                try:
+                    dividend_dates[symbol] = future.result()
+                except ValueError as e:
+                    logger.warning("Skipping dividend date for %s: %s", symbol, e)
+                    dividend_dates[symbol] = None
+
+        return dividend_dates
+
     def get_dividend_info(self, symbol: str) -> DividendInfo:
         """
         Get comprehensive dividend information for a ticker symbol.
@@ -78,36 +289,18 @@ class YahooFinanceClient:
             ValueError: If the symbol is invalid or not found
         """
         try:
-            logger.debug(f"Fetching dividend info for symbol: {symbol}")
+            logger.debug("Fetching dividend info for symbol: %s", symbol)
 
-            ticker = yf.Ticker(symbol)
-            info = ticker.info
+            info = self._fetch_info(symbol)
 
-            # Get next dividend date
-            next_dividend_date = self.get_next_dividend_date(symbol)
+            next_dividend_date, ex_dividend_date, pay_date = (
+                self._extract_dividend_dates(info)
+            )
 
             # Extract dividend information from ticker info
             dividend_rate = info.get("dividendRate")
             dividend_yield = info.get("dividendYield")
 
-            # Get ex-dividend date
-            ex_dividend_date = None
-            if "exDividendDate" in info and info["exDividendDate"]:
-                ex_div_timestamp = info["exDividendDate"]
-                if isinstance(ex_div_timestamp, (int, float)):
-                    ex_dividend_date = datetime.fromtimestamp(ex_div_timestamp)
-                elif isinstance(ex_div_timestamp, Timestamp):
-                    ex_dividend_date = ex_div_timestamp.to_pydatetime()
-
-            # Get pay date (if available)
-            pay_date = None
-            if "payoutDate" in info and info["payoutDate"]:
-                payout_timestamp = info["payoutDate"]
-                if isinstance(payout_timestamp, (int, float)):
-                    pay_date = datetime.fromtimestamp(payout_timestamp)
-                elif isinstance(payout_timestamp, Timestamp):
-                    pay_date = payout_timestamp.to_pydatetime()
-
             return DividendInfo(
                 symbol=symbol,
                 next_dividend_date=next_dividend_date,
@@ -137,10 +330,9 @@ class YahooFinanceClient:
             ValueError: If the symbol is invalid or not found
         """
         try:
-            logger.debug(f"Fetching stock info for symbol: {symbol}")
+            logger.debug("Fetching stock info for symbol: %s", symbol)
 
-            ticker = yf.Ticker(symbol)
-            info = ticker.info
+            info = self._fetch_info(symbol)
 
             return StockInfo(
                 symbol=symbol,
@@ -155,3 +347,62 @@ class YahooFinanceClient:
         except Exception as e:
             logger.error(f"Error fetching stock info for {symbol}: {str(e)}")
             raise ValueError(f"Failed to get stock info for symbol {symbol}: {str(e)}")
+
+    def _fetch_quotes(self, symbols: List[str]) -> Dict[str, dict]:
+        """Fetch raw quotes for the symbols, QUOTE_BATCH_SIZE per request."""
+        # yfinance's shared session takes care of Yahoo's cookie and crumb
+        from yfinance.data import YfData
+
+        data = YfData(session=_get_session())
+        quotes: Dict[str, dict] = {}
+        remaining = iter(dict.fromkeys(symbols))
+        while chunk := list(islice(remaining, QUOTE_BATCH_SIZE)):
+            try:
+                response = data.get_raw_json(
+                    QUOTE_URL,
+                    params={"symbols": ",".join(chunk), "formatted": "false"},
+                    timeout=QUOTE_TIMEOUT_SECONDS,
+                )
+            except Exception as e:
+                logger.warning("Failed to fetch quotes for %s: %s", chunk, e)
+                continue
+
+            for quote in response.get("quoteResponse", {}).get("result") or []:
+                quotes[quote["symbol"]] = quote
+
+        return quotes
+
+    def get_dividend_info_many(self, symbols: List[str]) -> Dict[str, DividendInfo]:
+        """
+        Get dividend information for several symbols using batched quotes.
+
+        Args:
+            symbols: The ticker symbols (e.g., ['AAPL', 'MSFT'])
+
+        Returns:
+            Mapping of symbol to DividendInfo for every symbol Yahoo returned
+        """
+        quotes = self._fetch_quotes(symbols)
+        ex_dividend_dates = _epochs_to_datetimes(
+            [quote.get("exDividendDate") for quote in quotes.values()]
+        )
+        pay_dates = _epochs_to_datetimes(
+            [quote.get("dividendDate") for quote in quotes.values()]
+        )
+
+        dividend_info: Dict[str, DividendInfo] = {}
+        for (symbol, quote), ex_dividend_date, pay_date in zip(
+            quotes.items(), ex_dividend_dates, pay_dates
+        ):
+            dividend_info[symbol] = DividendInfo(
+                symbol=symbol,
+                next_dividend_date=ex_dividend_date,
+                dividend_rate=quote.get("dividendRate")
+                or quote.get("trailingAnnualDividendRate"),
+                dividend_yield=quote.get("dividendYield")
+                or quote.get("trailingAnnualDividendYield"),
+                ex_dividend_date=ex_dividend_date,
+                pay_date=pay_date,
+            )
+
+        return dividend_info
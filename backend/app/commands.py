@@ -1,16 +1,24 @@
 import asyncio
-from typing import List
+import atexit
+import shlex
+import sys
 
+import click
 import typer
 from pydantic import EmailStr
-from sqlalchemy import delete
-from sqlalchemy.orm import selectinload
-from sqlalchemy.future import select
+from sqlalchemy import (
+    delete,
+    func,
+    literal_column,
+    select,
+    union_all,
+    update,
+)
 
-from .db.crud import get_user_by_email
 from .db.enums import UserRole
 from .db.models import User, Order, Instrument, Log, Base
 from .db.session import async_session, engine
+from .services.logging.buffer import flush_logs
 
 # Create the main CLI app
 app = typer.Typer(
@@ -19,6 +27,23 @@ app = typer.Typer(
     invoke_without_command=False,
 )
 
+# Every command runs on this one loop. asyncpg connections are bound to the
+# loop that opened them, so sharing it is what lets commands run from `shell`
+# reuse the engine's pooled connections instead of reconnecting each time.
+_runner = asyncio.Runner()
+
+
+def _run(coro):
+    """Run a coroutine on the shared CLI event loop."""
+    return _runner.run(coro)
+
+
+@atexit.register
+def _close_runner() -> None:
+    _runner.run(flush_logs())
+    _runner.run(engine.dispose())
+    _runner.close()
+
 
 async def _make_admin_async(email: EmailStr) -> bool:
     """
@@ -32,25 +57,25 @@ async def _make_admin_async(email: EmailStr) -> bool:
     """
     async with async_session() as db:
         try:
-            # Get user by email
-            user = await get_user_by_email(db, email)
+            # Promote in one round-trip; no row back means missing or already admin
+            stmt = (
+                update(User)
+                .where(User.email == email, User.role != UserRole.ADMIN)
+                .values(role=UserRole.ADMIN)
+                .returning(User.id)
+            )
+            promoted = (await db.execute(stmt)).scalar_one_or_none()
+            await db.commit()
 
-            if not user:
-                typer.echo(f"❌ User with email '{email}' not found.", err=True)
-                return False
+            if promoted is None:
+                exists = await db.scalar(select(User.id).where(User.email == email))
+                if exists is None:
+                    typer.echo(f"❌ User with email '{email}' not found.", err=True)
+                    return False
 
-            # Check if user is already admin
-            if user.role == UserRole.ADMIN:
                 typer.echo(f"ℹ️  User '{email}' is already an admin.")
                 return True
 
-            # Update user role to admin
-            user.role = UserRole.ADMIN
-
-            # Commit the changes
-            await db.commit()
-            await db.refresh(user)
-
             typer.echo(f"✅ Successfully made user '{email}' an admin.")
             return True
 
@@ -60,26 +85,57 @@ async def _make_admin_async(email: EmailStr) -> bool:
             return False
 
 
-async def _get_all_users_async() -> List[User]:
+LIST_USERS_YIELD_PER = 1000
+LIST_USERS_RULE = "=" * 120
+
+
+async def _list_users_async() -> int:
     """
-    Async helper function to get all users.
+    Async helper function to print all users as they are read.
+
+    Rows are streamed from a server-side cursor in batches of
+    LIST_USERS_YIELD_PER, so memory stays flat regardless of table size.
 
     Returns:
-        List[User]: List of all users in the system
+        int: Number of users printed
     """
+    stmt = (
+        select(
+            User.id,
+            User.first_name,
+            User.last_name,
+            User.email,
+            User.role,
+            User.created_at,
+        )
+        .order_by(User.created_at)
+        .execution_options(yield_per=LIST_USERS_YIELD_PER)
+    )
+
+    count = 0
     async with async_session() as db:
         try:
-            stmt = (
-                select(User)
-                .options(selectinload(User.settings))
-                .order_by(User.created_at)
-            )
-            result = await db.execute(stmt)
-            users = result.scalars().all()
-            return list(users)
+            result = await db.stream(stmt)
+            async for user in result:
+                if count == 0:
+                    typer.echo(LIST_USERS_RULE)
+                    typer.echo(
+                        f"{'ID':<36} {'Name':<25} {'Email':<30} {'Role':<10} {'Created':<19}"
+                    )
+                    typer.echo(LIST_USERS_RULE)
+
+                name = f"{user.first_name} {user.last_name}"
+                created_str = user.created_at.strftime("%Y-%m-%d %H:%M:%S")
+                typer.echo(
+                    f"{str(user.id):<36} {name:<25} {user.email:<30} {user.role.value:<10} {created_str:<19}"
+                )
+                count += 1
         except Exception as e:
             typer.echo(f"❌ Error fetching users: {str(e)}", err=True)
-            return []
+
+    if count:
+        typer.echo(LIST_USERS_RULE)
+    return count
 
 
 async def _delete_all_orders_async() -> bool:
@@ -91,20 +147,16 @@ async def _delete_all_orders_async() -> bool:
     """
     async with async_session() as db:
         try:
-            # Get count before deletion
-            count_stmt = select(Order)
-            count_result = await db.execute(count_stmt)
-            orders_count = len(list(count_result.scalars().all()))
+            # One DELETE whose rowcount doubles as the count, so nothing can
+            # slip in between counting and deleting
+            result = await db.execute(delete(Order))
+            await db.commit()
+            orders_count = result.rowcount
 
             if orders_count == 0:
                 typer.echo("ℹ️  No orders found to delete.")
                 return True
 
-            # Delete all orders
-            delete_stmt = delete(Order)
-            await db.execute(delete_stmt)
-            await db.commit()
-
             typer.echo(f"✅ Successfully deleted {orders_count} orders.")
             return True
 
@@ -124,7 +176,8 @@ async def _nuke_database_async() -> bool:
     """
     try:
         async with engine.begin() as conn:
-            # Drop all tables
+            # drop_all only touches the model tables, so the alembic_version
+            # stamp survives and `alembic upgrade head` stays a no-op
             await conn.run_sync(Base.metadata.drop_all)
             # Recreate all tables
             await conn.run_sync(Base.metadata.create_all)
@@ -146,29 +199,23 @@ async def _get_database_stats_async() -> dict:
     """
     async with async_session() as db:
         try:
-            stats = {}
-
-            # Count users
-            user_stmt = select(User)
-            user_result = await db.execute(user_stmt)
-            stats["users"] = len(list(user_result.scalars().all()))
-
-            # Count orders
-            order_stmt = select(Order)
-            order_result = await db.execute(order_stmt)
-            stats["orders"] = len(list(order_result.scalars().all()))
-
-            # Count instruments
-            instrument_stmt = select(Instrument)
-            instrument_result = await db.execute(instrument_stmt)
-            stats["instruments"] = len(list(instrument_result.scalars().all()))
-
-            # Count logs
-            log_stmt = select(Log)
-            log_result = await db.execute(log_stmt)
-            stats["logs"] = len(list(log_result.scalars().all()))
+            # All four counts in one UNION ALL query, so a single round-trip
+            stmt = union_all(
+                *(
+                    select(literal_column(f"'{label}'"), func.count()).select_from(
+                        model
+                    )
+                    for label, model in (
+                        ("users", User),
+                        ("orders", Order),
+                        ("instruments", Instrument),
+                        ("logs", Log),
+                    )
+                )
+            )
+            result = await db.execute(stmt)
 
-            return stats
+            return {label: count for label, count in result.all()}
 
         except Exception as e:
             typer.echo(f"❌ Error fetching database stats: {str(e)}", err=True)
@@ -184,20 +231,16 @@ async def _clear_logs_async() -> bool:
     """
     async with async_session() as db:
         try:
-            # Get count before deletion
-            count_stmt = select(Log)
-            count_result = await db.execute(count_stmt)
-            logs_count = len(list(count_result.scalars().all()))
+            # One DELETE whose rowcount doubles as the count, so nothing can
+            # slip in between counting and deleting
+            result = await db.execute(delete(Log))
+            await db.commit()
+            logs_count = result.rowcount
 
             if logs_count == 0:
                 typer.echo("ℹ️  No logs found to clear.")
                 return True
 
-            # Delete all logs
-            delete_stmt = delete(Log)
-            await db.execute(delete_stmt)
-            await db.commit()
-
             typer.echo(f"✅ Successfully cleared {logs_count} logs.")
             return True
 
@@ -219,25 +262,22 @@ async def _delete_user_logs_async(email: EmailStr) -> bool:
     """
     async with async_session() as db:
         try:
-            # Find the user by email
-            user = await get_user_by_email(db, email)
+            # Only the id is needed, so skip loading the User and its settings
+            user_id = await db.scalar(select(User.id).where(User.email == email))
 
-            if not user:
+            if user_id is None:
                 typer.echo(f"❌ User with email '{email}' not found.", err=True)
                 return False
 
-            # Get count before deletion
-            count_stmt = select(Log).where(Log.user_id == user.id)
-            count_result = await db.execute(count_stmt)
-            logs_count = len(list(count_result.scalars().all()))
+            # Delete logs for that user, using the affected row count as the total
+            delete_stmt = delete(Log).where(Log.user_id == user_id)
+            result = await db.execute(delete_stmt)
+            logs_count = result.rowcount
 
             if logs_count == 0:
                 typer.echo(f"ℹ️  No logs found for user '{email}'.")
                 return True
 
-            # Delete logs for that user
-            delete_stmt = delete(Log).where(Log.user_id == user.id)
-            await db.execute(delete_stmt)
             await db.commit()
 
             typer.echo(f"✅ Successfully deleted {logs_count} logs for user '{email}'.")
@@ -268,7 +308,7 @@ def make_admin(
     typer.echo(f"🔄 Making user '{email}' an admin...")
 
     # Run the async function
-    success = asyncio.run(_make_admin_async(email))
+    success = _run(_make_admin_async(email))
 
     if not success:
         raise typer.Exit(1)
@@ -285,31 +325,16 @@ def list_users() -> None:
     Example:
         python -m app.commands list-users
     """
-    typer.echo("🔄 Fetching all users...")
+    typer.echo("🔄 Fetching all users...\n")
 
     # Run the async function
-    users = asyncio.run(_get_all_users_async())
+    count = _run(_list_users_async())
 
-    if not users:
+    if not count:
         typer.echo("ℹ️  No users found in the system.")
         return
 
-    typer.echo(f"\n📊 Found {len(users)} users:\n")
-
-    # Print header
-    typer.echo("=" * 120)
-    typer.echo(f"{'ID':<36} {'Name':<25} {'Email':<30} {'Role':<10} {'Created':<19}")
-    typer.echo("=" * 120)
-
-    # Print user details
-    for user in users:
-        name = f"{user.first_name} {user.last_name}"
-        created_str = user.created_at.strftime("%Y-%m-%d %H:%M:%S")
-        typer.echo(
-            f"{str(user.id):<36} {name:<25} {user.email:<30} {user.role.value:<10} {created_str:<19}"
-        )
-
-    typer.echo("=" * 120)
+    typer.echo(f"\n📊 Found {count} users.")
 
 
 @app.command(name="delete-orders")
@@ -339,7 +364,7 @@ def delete_orders(
     typer.echo("🔄 Deleting all orders...")
 
     # Run the async function
-    success = asyncio.run(_delete_all_orders_async())
+    success = _run(_delete_all_orders_async())
 
     if not success:
         raise typer.Exit(1)
@@ -393,7 +418,7 @@ def nuke_database(
     typer.echo("💥 Nuking database...")
 
     # Run the async function
-    success = asyncio.run(_nuke_database_async())
+    success = _run(_nuke_database_async())
 
     if not success:
         raise typer.Exit(1)
@@ -412,7 +437,7 @@ def database_stats() -> None:
     typer.echo("🔄 Fetching database statistics...")
 
     # Run the async function
-    stats = asyncio.run(_get_database_stats_async())
+    stats = _run(_get_database_stats_async())
 
     if not stats:
         typer.echo("❌ Failed to fetch database statistics.")
@@ -454,7 +479,7 @@ def clear_logs(
     typer.echo("🔄 Clearing all logs...")
 
     # Run the async function
-    success = asyncio.run(_clear_logs_async())
+    success = _run(_clear_logs_async())
 
     if not success:
         raise typer.Exit(1)
@@ -490,11 +515,51 @@ def delete_user_logs(
     typer.echo(f"🔄 Deleting logs for user '{email}'...")
 
     # Run the async function
-    success = asyncio.run(_delete_user_logs_async(email))
+    success = _run(_delete_user_logs_async(email))
 
     if not success:
         raise typer.Exit(1)
 
 
+@app.command(name="shell")
+def shell() -> None:
+    """
+    Run several commands in one process, reading one command per line.
+
+    All commands share one event loop and database connection pool, so a
+    batch of them only pays the connection handshake once. Commands that
+    prompt read their answers from the following lines, so pass options such
+    as --email or --confirm explicitly when piping. Type 'exit' to quit.
+
+    Example:
+        printf 'db-stats\\nlist-users\\n' | python -m app.commands shell
+    """
+    interactive = sys.stdin.isatty()
+
+    while True:
+        if interactive:
+            typer.echo("auto-trader> ", nl=False)
+
+        line = sys.stdin.readline()
+        if not line:
+            break
+
+        args = shlex.split(line)
+        if not args:
+            continue
+        if args[0] in ("exit", "quit"):
+            break
+        if args[0] == "shell":
+            typer.echo("ℹ️  Already in a shell.")
+            continue
+
+        try:
+            app(args, prog_name="shell", standalone_mode=False)
+        except click.ClickException as e:
+            e.show()
+        except click.Abort:
+            typer.echo("❌ Operation cancelled.")
+
+
 if __name__ == "__main__":
     app()
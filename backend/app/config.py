@@ -1,5 +1,7 @@
 import logging
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional
 
 from aiocache import caches
 from app.lib.cache import parse_redis_url
@@ -11,6 +13,22 @@ class Settings(BaseSettings):
     ENV: str = "development"
     DEBUG: bool = False
     DATABASE_URL: str = Field(..., env="DATABASE_URL")
+    DATABASE_POOL_SIZE: int = Field(
+        default=20,
+        env="DATABASE_POOL_SIZE",
+        description="Number of database connections kept open per process",
+    )
+    DATABASE_MAX_OVERFLOW: int = Field(
+        default=40,
+        env="DATABASE_MAX_OVERFLOW",
+        description="Extra database connections allowed beyond the pool size",
+    )
+    DATABASE_EXTERNAL_POOL: bool = Field(
+        default=False,
+        env="DATABASE_EXTERNAL_POOL",
+        description="Leave pooling to PgBouncer (transaction mode) in front of "
+        "Postgres instead of keeping a pool per process",
+    )
     DRAMATIQ_BROKER_URL: str = Field(..., env="DRAMATIQ_BROKER_URL")
     SECRET_KEY: str = Field(..., env="SECRET_KEY")
     BASE_DIR: str = Field(
@@ -134,37 +152,59 @@ class Settings(BaseSettings):
     model_config = SettingsConfigDict(env_file=".env")
 
 
-settings = Settings()
+@lru_cache
+def get_settings() -> Settings:
+    """
+    Return the process-wide Settings, parsing the environment only once.
 
+    Usable as a FastAPI dependency and overridable in tests via
+    `get_settings.cache_clear()`.
+    """
+    return Settings()
 
-LOGGING_CONFIG = {
-    "version": 1,
-    "disable_existing_loggers": False,
-    "formatters": {
-        "default": {
-            "format": "[%(asctime)s] [%(levelname)s] [%(name)s] %(message)s",
-        },
-    },
-    "handlers": {
-        "console": {
-            "class": "logging.StreamHandler",
-            "formatter": "default",
+
+settings = get_settings()
+
+
+def build_logging_config(level: Optional[int] = None) -> dict:
+    """
+    Build the dictConfig for the app, dramatiq and root loggers.
+
+    Called explicitly at process startup so importing this module doesn't
+    require the logging level to be resolved.
+    """
+    if level is None:
+        level = get_settings().LOG_LEVEL
+
+    return {
+        "version": 1,
+        "disable_existing_loggers": False,
+        "formatters": {
+            "default": {
+                "format": "[%(asctime)s] [%(levelname)s] [%(name)s] %(message)s",
+            },
         },
-    },
-    "loggers": {
-        "app": {
-            "level": settings.LOG_LEVEL,
-            "handlers": ["console"],
-            "propagate": False,
+        "handlers": {
+            "console": {
+                "class": "logging.StreamHandler",
+                "formatter": "default",
+            },
         },
-        "dramatiq": {
-            "level": settings.LOG_LEVEL,
-            "handlers": ["console"],
-            "propagate": False,
+        "loggers": {
+            "app": {
+                "level": level,
+                "handlers": ["console"],
+                "propagate": False,
+            },
+            "dramatiq": {
+                "level": level,
+                "handlers": ["console"],
+                "propagate": False,
+            },
         },
-    },
-    "root": {"level": settings.LOG_LEVEL, "handlers": ["console"], "propagate": False},
-}
+        "root": {"level": level, "handlers": ["console"], "propagate": False},
+    }
+
 
 redis_config = parse_redis_url(settings.REDIS_URL)
 
@@ -194,5 +234,9 @@ caches.set_config(
             **BASE_REDIS_CONFIG,
             "namespace": "ig_requests",
         },
+        "user_lookups": {
+            **BASE_REDIS_CONFIG,
+            "namespace": "user_lookups",
+        },
     }
 )
@@ -1,13 +1,123 @@
+import asyncio
+import hashlib
+import hmac
+import logging
+import time
 import uuid
-from typing import Optional
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
 
-from app.db.deps import get_db_context
-from app.db.enums import LogType, UserRole
+from aiocache import caches
+from app.db.enums import UserRole
 from app.db.models import Instrument, Log, Order, User, UserSettings, AppSettings
+from app.services.utils import webhook_secret_lookup_hash
 from fastapi import HTTPException, status
+from sqlalchemy import (
+    bindparam,
+    insert,
+    inspect,
+    lambda_stmt,
+    or_,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.future import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import contains_eager, joinedload, raiseload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+
+# Webhook alerts look the user up by secret several times per alert, and the
+# secret query has to search both settings columns. Matches are remembered as
+# secret hash -> user id so repeat lookups become a primary-key load.
+WEBHOOK_SECRET_CACHE_TTL_SECONDS = 600
+_webhook_secret_user_ids: Dict[str, Tuple[uuid.UUID, float]] = {}
+_webhook_secret_lookups: Dict[
+    Tuple[asyncio.AbstractEventLoop, str], asyncio.Future
+] = {}
+_LOOKUP_FAILED = object()
+# The same mapping shared through Redis, so a match found by one API or worker
+# process saves the search in all the others
+_shared_webhook_secret_user_ids = caches.get("user_lookups")
+
+logger = logging.getLogger(__name__)
+
+# Every alert resolves its instrument by (user, market_and_symbol), usually
+# more than once. Only the id is remembered: instruments carry per-alert state
+# (last_alert_received_at), so the row itself is always loaded fresh.
+INSTRUMENT_ID_CACHE_TTL_SECONDS = 600
+INSTRUMENT_ID_CACHE_MAX_SIZE = 10_000
+_instrument_ids: Dict[Tuple[uuid.UUID, str], Tuple[uuid.UUID, float]] = {}
+
+
+# Hot lookups are built once as lambda statements, so each call skips
+# constructing the statement and goes straight to the cached compiled SQL
+_GET_MARKET_AND_SYMBOL_BY_IG_EPIC = lambda_stmt(
+    lambda: select(Instrument.market_and_symbol)
+    .where(
+        Instrument.user_id == bindparam("user_id"),
+        Instrument.ig_epic == bindparam("ig_epic"),
+    )
+    .limit(1)
+)
+_GET_USER_BY_EMAIL = lambda_stmt(
+    lambda: select(User)
+    .options(joinedload(User.settings), raiseload("*"))
+    .where(User.email == bindparam("email"))
+)
+_GET_USER_BY_REFRESH_TOKEN = lambda_stmt(
+    lambda: select(User)
+    .options(raiseload("*"))
+    .where(User.refresh_token == bindparam("refresh_token"))
+)
+_GET_INSTRUMENT_BY_IG_EPIC = lambda_stmt(
+    lambda: select(Instrument).where(Instrument.ig_epic == bindparam("ig_epic"))
+)
+_GET_INSTRUMENT_BY_MARKET_AND_SYMBOL = lambda_stmt(
+    lambda: select(Instrument).where(
+        Instrument.market_and_symbol == bindparam("market_and_symbol"),
+        Instrument.user_id == bindparam("user_id"),
+    )
+)
+_GET_USER_BY_ID = lambda_stmt(
+    lambda: select(User)
+    .options(joinedload(User.settings), raiseload("*"))
+    .where(User.id == bindparam("user_id"))
+)
+_GET_ADMIN_USERS = lambda_stmt(
+    lambda: select(User)
+    .options(raiseload("*"))
+    .where(User.role == bindparam("role"))
+)
+_GET_ORDER_BY_ID = lambda_stmt(
+    lambda: select(Order)
+    .options(
+        selectinload(Order.instrument)
+        .selectinload(Instrument.user)
+        .selectinload(User.settings),
+        raiseload("*"),
+    )
+    .where(Order.id == bindparam("order_id"))
+)
+_GET_ORDER_BY_DEAL_ID = lambda_stmt(
+    lambda: select(Order)
+    .options(
+        selectinload(Order.instrument)
+        .selectinload(Instrument.user)
+        .selectinload(User.settings),
+        raiseload("*"),
+    )
+    .where(Order.deal_id == bindparam("deal_id"))
+)
+
+
+# Updatable column attributes per model; relationships and methods are excluded
+_INSTRUMENT_COLUMNS = frozenset(inspect(Instrument).columns.keys())
+_ORDER_COLUMNS = frozenset(inspect(Order).columns.keys())
+
+
+def _users_by_email(db: AsyncSession) -> Dict[str, User]:
+    """Users already loaded by email in this session (i.e. this request)."""
+    return db.info.setdefault("users_by_email", {})
 
 
 async def get_market_and_symbol_by_ig_epic(
@@ -24,48 +134,53 @@ async def get_market_and_symbol_by_ig_epic(
     Returns:
         market_and_symbol if found, None otherwise
     """
-    stmt = select(Instrument).where(
-        Instrument.user_id == user_id, Instrument.ig_epic == ig_epic
+    return await db.scalar(
+        _GET_MARKET_AND_SYMBOL_BY_IG_EPIC, {"user_id": user_id, "ig_epic": ig_epic}
     )
-    result = await db.execute(stmt)
-    instrument = result.scalar_one_or_none()
 
-    return instrument.market_and_symbol if instrument else None
 
+IG_EPIC_LOOKUP_CHUNK_SIZE = 500
 
-async def log_message(
-    message: str,
-    description: Optional[str],
-    log_type: LogType,
-    user_id: uuid.UUID,
-    extra: Optional[dict] = None,
-    identifier: Optional[str] = None,
-) -> Log:
+
+async def get_market_and_symbols_by_ig_epics(
+    db: AsyncSession, user_id: uuid.UUID, ig_epics: List[str]
+) -> Dict[str, str]:
     """
-    Logs a message to the database.
+    Get market_and_symbol for many ig_epics from user's instruments at once.
 
     Args:
-        message (str): The log message.
-        log_type (LogType): The type of log.
-        extra (Optional[dict]): Additional information to log.
+        db: Database session
+        user_id: User ID
+        ig_epics: IG epics to search for
 
     Returns:
-        Log: The created log entry.
+        Mapping of ig_epic to market_and_symbol for the epics that were found
     """
-
-    async with get_db_context() as db:
-        log_entry = Log(
-            message=message,
-            description=description,
-            type=log_type,
-            extra=extra,
-            user_id=user_id,
-            identifier=identifier,
+    unique_epics = list(dict.fromkeys(epic for epic in ig_epics if epic))
+    market_and_symbols: Dict[str, str] = {}
+
+    # Chunked to keep the IN list well inside the bind parameter limit
+    for i in range(0, len(unique_epics), IG_EPIC_LOOKUP_CHUNK_SIZE):
+        chunk = unique_epics[i : i + IG_EPIC_LOOKUP_CHUNK_SIZE]
+        stmt = select(Instrument.ig_epic, Instrument.market_and_symbol).where(
+            Instrument.user_id == user_id, Instrument.ig_epic.in_(chunk)
         )
-        db.add(log_entry)
-        await db.commit()
-        await db.refresh(log_entry)
-        return log_entry
+        for ig_epic, market_and_symbol in await db.execute(stmt):
+            market_and_symbols.setdefault(ig_epic, market_and_symbol)
+
+    return market_and_symbols
+
+
+async def create_logs(db: AsyncSession, entries: List[dict]) -> None:
+    """
+    Insert a batch of log entries in one statement and commit.
+
+    Args:
+        db (AsyncSession): The database session.
+        entries (List[dict]): Log column values, one dict per entry.
+    """
+    await db.execute(insert(Log), entries)
+    await db.commit()
 
 
 async def get_user_by_email(db: AsyncSession, email: str) -> User | None:
@@ -78,10 +193,16 @@ async def get_user_by_email(db: AsyncSession, email: str) -> User | None:
     Returns:
         User: The user object if found, otherwise raises an error.
     """
-    stmt = select(User).options(selectinload(User.settings)).where(User.email == email)
-    result = await db.execute(stmt)
-    user = result.scalar_one_or_none()
+    users = _users_by_email(db)
+    user = users.get(email)
+    # A rollback expires the instance, so fall back to a fresh query then
+    if user is not None and not inspect(user).expired_attributes:
+        return user
 
+    user = await db.scalar(_GET_USER_BY_EMAIL, {"email": email})
+
+    if user is not None:
+        users[email] = user
     return user
 
 
@@ -95,9 +216,7 @@ async def get_user_by_id(db: AsyncSession, user_id: uuid.UUID) -> User:
     Returns:
         User: The user object if found, otherwise raises an error.
     """
-    stmt = select(User).options(selectinload(User.settings)).where(User.id == user_id)
-    result = await db.execute(stmt)
-    user = result.scalar_one_or_none()
+    user = await db.scalar(_GET_USER_BY_ID, {"user_id": user_id})
 
     return user
 
@@ -114,30 +233,59 @@ async def get_user_by_refresh_token(
     Returns:
         User: The user object if found, otherwise raises an error.
     """
-    stmt = select(User).where(User.refresh_token == refresh_token)
-    result = await db.execute(stmt)
-    user = result.scalar_one_or_none()
+    user = await db.scalar(
+        _GET_USER_BY_REFRESH_TOKEN, {"refresh_token": refresh_token}
+    )
 
     return user
 
 
-async def update_user(db: AsyncSession, email: str, user_data: dict) -> User:
+async def update_user(db: AsyncSession, user: User, user_data: dict) -> User:
     """
     Update an existing user in the database.
 
+    Takes the already-loaded user so callers don't pay for a second lookup.
+
     :param db: The database session.
-    :param user_id: The ID of the user to update.
+    :param user: The user to update, loaded in this session.
     :param user_data: A dictionary containing the updated user data.
-    :return: The updated user object if found, otherwise None.
+    :return: The updated user object.
     """
-    user = await get_user_by_email(db, email)
+    # The email may change, so don't leave it cached under the old one
+    _users_by_email(db).pop(user.email, None)
 
-    for key, value in user_data.items():
-        setattr(user, key, value)
+    # Single UPDATE ... RETURNING round-trip; the ORM syncs the returned row
+    # back onto the in-session user, so no refresh is needed afterwards
+    stmt = (
+        update(User)
+        .where(User.id == user.id)
+        .values(**user_data)
+        .returning(User)
+    )
+    result = await db.execute(stmt)
+    updated_user = result.scalar_one()
 
     await db.commit()
-    await db.refresh(user)
-    return user
+    return updated_user
+
+
+def with_webhook_secret_hashes(settings_data: dict) -> dict:
+    """
+    Add the lookup hash for any webhook secret in a settings update.
+
+    Args:
+        settings_data (dict): UserSettings column values about to be written.
+
+    Returns:
+        dict: A copy of settings_data with the matching *_webhook_secret_hash
+        values, so the hashes stay in step with the secrets.
+    """
+    hashes = {
+        f"{key}_hash": webhook_secret_lookup_hash(settings_data[key])
+        for key in ("demo_webhook_secret", "live_webhook_secret")
+        if key in settings_data
+    }
+    return {**settings_data, **hashes}
 
 
 async def update_user_settings(
@@ -151,25 +299,65 @@ async def update_user_settings(
     :return: The updated user object with the new settings.
     """
 
-    user = await get_user_by_email(db, email)
+    # The upsert returns the settings row, so don't join it in here as well
+    stmt = select(User).options(raiseload("*")).where(User.email == email)
+    user = await db.scalar(stmt)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"User with email '{email}' not found.",
         )
 
-    user_settings = user.settings or UserSettings(user_id=user.id)
-
-    for key, value in settings_data.items():
-        setattr(user_settings, key, value)
+    settings_data = with_webhook_secret_hashes(settings_data)
+
+    if db.bind.dialect.name == "postgresql":
+        # Create-or-update in one statement. ON CONFLICT doesn't apply onupdate
+        # defaults, so updated_at is set explicitly.
+        stmt = (
+            pg_insert(UserSettings)
+            .values(user_id=user.id, **settings_data)
+            .on_conflict_do_update(
+                index_elements=[UserSettings.user_id],
+                set_={**settings_data, "updated_at": datetime.now(timezone.utc)},
+            )
+            .returning(UserSettings)
+            .execution_options(populate_existing=True)
+        )
+        user_settings = (await db.execute(stmt)).scalar_one()
+    else:
+        # Other backends (SQLite in local development) go through the ORM
+        user_settings = await db.scalar(
+            select(UserSettings).where(UserSettings.user_id == user.id)
+        )
+        if user_settings is None:
+            user_settings = UserSettings(user_id=user.id)
+            db.add(user_settings)
 
-    user.settings = user_settings
-    db.add(user)
+        for key, value in settings_data.items():
+            setattr(user_settings, key, value)
     await db.commit()
-    await db.refresh(user)
+
+    # Attach without marking the user dirty; the row is already written
+    set_committed_value(user, "settings", user_settings)
     return user
 
 
+async def find_instrument_by_ig_epic(
+    db: AsyncSession, ig_epic: str
+) -> Optional[Instrument]:
+    """
+    Find an instrument by its IG epic without raising an exception.
+
+    Args:
+        db (AsyncSession): The database session.
+        ig_epic (str): The IG epic of the instrument to find.
+
+    Returns:
+        Instrument: The instrument object if found, None otherwise.
+    """
+    return await db.scalar(_GET_INSTRUMENT_BY_IG_EPIC, {"ig_epic": ig_epic})
+
+
 async def get_instrument_by_ig_epic(db: AsyncSession, ig_epic: str) -> Instrument:
     """
     Retrieve an instrument by its IG epic.
@@ -179,11 +367,9 @@ async def get_instrument_by_ig_epic(db: AsyncSession, ig_epic: str) -> Instrumen
         ig_epic (str): The IG epic of the instrument to retrieve.
 
     Returns:
-        Instrument: The instrument object if found, otherwise None.
+        Instrument: The instrument object if found, otherwise raises an error.
     """
-    stmt = select(Instrument).where(Instrument.ig_epic == ig_epic)
-    result = await db.execute(stmt)
-    instrument = result.scalar_one_or_none()
+    instrument = await find_instrument_by_ig_epic(db, ig_epic)
 
     if not instrument:
         raise HTTPException(
@@ -194,6 +380,96 @@ async def get_instrument_by_ig_epic(db: AsyncSession, ig_epic: str) -> Instrumen
     return instrument
 
 
+def _webhook_secret_matches(
+    user_settings: Optional[UserSettings], secret: str
+) -> bool:
+    """Compare the secret against both of a user's secrets in constant time."""
+    if user_settings is None:
+        return False
+    return any(
+        candidate is not None and hmac.compare_digest(candidate, secret)
+        for candidate in (
+            user_settings.demo_webhook_secret,
+            user_settings.live_webhook_secret,
+        )
+    )
+
+
+async def _get_user_by_id_with_secret(
+    db: AsyncSession, user_id: uuid.UUID, secret: str
+) -> Optional[User]:
+    """Load a user by primary key, provided the webhook secret is still theirs."""
+    user = await db.get(
+        User, user_id, options=[joinedload(User.settings), raiseload("*")]
+    )
+    # Secrets can be rotated, so only trust the id if it still matches
+    if user is not None and _webhook_secret_matches(user.settings, secret):
+        return user
+    return None
+
+
+def _remember_webhook_secret_user_id(key: str, user_id: uuid.UUID) -> None:
+    _webhook_secret_user_ids[key] = (
+        user_id,
+        time.monotonic() + WEBHOOK_SECRET_CACHE_TTL_SECONDS,
+    )
+
+
+async def _find_user_by_webhook_secret(
+    db: AsyncSession, key: str, secret: str
+) -> Optional[User]:
+    """Search user settings for the secret and remember the match."""
+    # Probe the fixed-width hash indexes rather than comparing the raw secret
+    # in SQL; a plain join fills User.settings from the same row
+    lookup_hash = webhook_secret_lookup_hash(secret)
+    stmt = (
+        select(User)
+        .join(User.settings)
+        .options(contains_eager(User.settings), raiseload("*"))
+        .where(
+            or_(
+                UserSettings.demo_webhook_secret_hash == lookup_hash,
+                UserSettings.live_webhook_secret_hash == lookup_hash,
+            )
+        )
+    )
+    # The hash is short, so confirm the secret itself on the candidates
+    candidates = await db.scalars(stmt)
+    user = next(
+        (c for c in candidates if _webhook_secret_matches(c.settings, secret)),
+        None,
+    )
+
+    if user is not None:
+        _remember_webhook_secret_user_id(key, user.id)
+        try:
+            await _shared_webhook_secret_user_ids.set(
+                key, user.id, ttl=WEBHOOK_SECRET_CACHE_TTL_SECONDS
+            )
+        except Exception as e:
+            logger.warning(f"Failed to share webhook secret lookup: {e}")
+    return user
+
+
+async def _resolve_user_by_webhook_secret(
+    db: AsyncSession, key: str, secret: str
+) -> Optional[User]:
+    """Try the id another process found for this secret before searching."""
+    try:
+        user_id = await _shared_webhook_secret_user_ids.get(key)
+    except Exception as e:
+        logger.warning(f"Failed to read shared webhook secret lookup: {e}")
+        user_id = None
+
+    if user_id is not None:
+        user = await _get_user_by_id_with_secret(db, user_id, secret)
+        if user is not None:
+            _remember_webhook_secret_user_id(key, user.id)
+            return user
+
+    return await _find_user_by_webhook_secret(db, key, secret)
+
+
 async def get_user_by_webhook_secret(db: AsyncSession, secret: str) -> Optional[User]:
     """
     Retrieve a user by their webhook secret.
@@ -205,18 +481,37 @@ async def get_user_by_webhook_secret(db: AsyncSession, secret: str) -> Optional[
     Returns:
         User: The user object if found, otherwise None.
     """
-    stmt = (
-        select(User)
-        .options(selectinload(User.settings))
-        .where(
-            (User.settings.has(UserSettings.demo_webhook_secret == secret))
-            | (User.settings.has(UserSettings.live_webhook_secret == secret))
-        )
-    )
-    result = await db.execute(stmt)
-    user = result.scalar_one_or_none()
-
-    return user
+    key = hashlib.sha256(secret.encode()).hexdigest()
+    cached = _webhook_secret_user_ids.get(key)
+    if cached is not None and cached[1] > time.monotonic():
+        user = await _get_user_by_id_with_secret(db, cached[0], secret)
+        if user is not None:
+            return user
+    _webhook_secret_user_ids.pop(key, None)
+
+    # An alert burst for one secret misses the cache all at once; let the first
+    # caller search while the rest wait for its answer. Only the id is shared,
+    # as each caller needs the user loaded in its own session.
+    inflight_key = (asyncio.get_running_loop(), key)
+    inflight = _webhook_secret_lookups.get(inflight_key)
+    if inflight is not None:
+        user_id = await asyncio.shield(inflight)
+        if user_id is _LOOKUP_FAILED:
+            return await _find_user_by_webhook_secret(db, key, secret)
+        if user_id is None:
+            return None
+        return await _get_user_by_id_with_secret(db, user_id, secret)
+
+    future = asyncio.get_running_loop().create_future()
+    _webhook_secret_lookups[inflight_key] = future
+    user_id = _LOOKUP_FAILED
+    try:
+        user = await _resolve_user_by_webhook_secret(db, key, secret)
+        user_id = user.id if user is not None else None
+        return user
+    finally:
+        del _webhook_secret_lookups[inflight_key]
+        future.set_result(user_id)
 
 
 async def get_instrument_by_market_and_symbol(
@@ -232,12 +527,32 @@ async def get_instrument_by_market_and_symbol(
     Returns:
         Instrument: The instrument object if found, otherwise raises an error.
     """
-    stmt = select(Instrument).where(
-        Instrument.market_and_symbol == market_and_symbol, Instrument.user_id == user.id
+    key = (user.id, market_and_symbol)
+    cached = _instrument_ids.get(key)
+    if cached is not None and cached[1] > time.monotonic():
+        # A primary-key load, free if this session already holds the row
+        instrument = await db.get(Instrument, cached[0])
+        # Instruments can be deleted or renamed, so check it still matches
+        if (
+            instrument is not None
+            and instrument.user_id == user.id
+            and instrument.market_and_symbol == market_and_symbol
+        ):
+            return instrument
+    _instrument_ids.pop(key, None)
+
+    instrument = await db.scalar(
+        _GET_INSTRUMENT_BY_MARKET_AND_SYMBOL,
+        {"market_and_symbol": market_and_symbol, "user_id": user.id},
     )
-    result = await db.execute(stmt)
-    instrument = result.scalar_one_or_none()
 
+    if instrument is not None:
+        if len(_instrument_ids) >= INSTRUMENT_ID_CACHE_MAX_SIZE:
+            _instrument_ids.clear()
+        _instrument_ids[key] = (
+            instrument.id,
+            time.monotonic() + INSTRUMENT_ID_CACHE_TTL_SECONDS,
+        )
     return instrument
 
 
@@ -258,9 +573,23 @@ async def update_instrument(
     Raises:
         HTTPException: If the instrument is not found.
     """
-    stmt = select(Instrument).where(Instrument.id == instrument_id)
-    result = await db.execute(stmt)
-    instrument = result.scalar_one_or_none()
+    values = {
+        key: value
+        for key, value in update_data.items()
+        if key in _INSTRUMENT_COLUMNS
+    }
+    if values:
+        # Single UPDATE ... RETURNING round-trip instead of SELECT, UPDATE, SELECT
+        stmt = (
+            update(Instrument)
+            .where(Instrument.id == instrument_id)
+            .values(**values)
+            .returning(Instrument)
+        )
+        instrument = await db.scalar(stmt)
+    else:
+        # Nothing to set; an empty UPDATE isn't valid SQL
+        instrument = await db.get(Instrument, instrument_id)
 
     if not instrument:
         raise HTTPException(
@@ -268,13 +597,7 @@ async def update_instrument(
             detail=f"Instrument with ID '{instrument_id}' not found.",
         )
 
-    # Update the instrument with the provided data
-    for key, value in update_data.items():
-        if hasattr(instrument, key):
-            setattr(instrument, key, value)
-
     await db.commit()
-    await db.refresh(instrument)
     return instrument
 
 
@@ -294,8 +617,9 @@ async def create_order_for_instrument(
 
     order = Order(instrument_id=instrument.id, user_id=instrument.user_id)
     db.add(order)
+    # All defaults are client-side and the session doesn't expire on commit,
+    # so the instance is complete without a refresh
     await db.commit()
-    await db.refresh(order)
     return order
 
 
@@ -310,9 +634,7 @@ async def delete_order(db: AsyncSession, order_id: uuid.UUID) -> None:
     Returns:
         None
     """
-    stmt = select(Order).where(Order.id == order_id)
-    result = await db.execute(stmt)
-    order = result.scalar_one_or_none()
+    order = await db.get(Order, order_id)
 
     if not order:
         raise HTTPException(
@@ -338,9 +660,18 @@ async def update_order(
     Returns:
         Order: The updated order object.
     """
-    stmt = select(Order).where(Order.id == order_id)
-    result = await db.execute(stmt)
-    order = result.scalar_one_or_none()
+    values = {
+        key: value for key, value in update_data.items() if key in _ORDER_COLUMNS
+    }
+    if values:
+        # Single UPDATE ... RETURNING round-trip instead of SELECT, UPDATE, SELECT
+        stmt = (
+            update(Order).where(Order.id == order_id).values(**values).returning(Order)
+        )
+        order = await db.scalar(stmt)
+    else:
+        # Nothing to set; an empty UPDATE isn't valid SQL
+        order = await db.get(Order, order_id)
 
     if not order:
         raise HTTPException(
@@ -348,16 +679,24 @@ async def update_order(
             detail=f"Order with ID '{order_id}' not found.",
         )
 
-    # Update the order with the provided data
-    for key, value in update_data.items():
-        if hasattr(order, key):
-            setattr(order, key, value)
-
     await db.commit()
-    await db.refresh(order)
     return order
 
 
+async def find_order_by_id(db: AsyncSession, order_id: uuid.UUID) -> Optional[Order]:
+    """
+    Find an order by its ID without raising an exception.
+
+    Args:
+        db (AsyncSession): The database session.
+        order_id (uuid.UUID): The ID of the order to find.
+
+    Returns:
+        Order: The order object if found, None otherwise.
+    """
+    return await db.scalar(_GET_ORDER_BY_ID, {"order_id": order_id})
+
+
 async def get_order_by_id(db: AsyncSession, order_id: uuid.UUID) -> Order:
     """
     Retrieve an order by its ID.
@@ -369,17 +708,7 @@ async def get_order_by_id(db: AsyncSession, order_id: uuid.UUID) -> Order:
     Returns:
         Order: The order object if found, otherwise raises an error.
     """
-    stmt = (
-        select(Order)
-        .options(
-            selectinload(Order.instrument)
-            .selectinload(Instrument.user)
-            .selectinload(User.settings)
-        )
-        .where(Order.id == order_id)
-    )
-    result = await db.execute(stmt)
-    order = result.scalar_one_or_none()
+    order = await find_order_by_id(db, order_id)
 
     if not order:
         raise HTTPException(
@@ -401,17 +730,7 @@ async def get_order_by_deal_id(db: AsyncSession, deal_id: str) -> Order:
     Returns:
         Order: The order object if found, otherwise raises an error.
     """
-    stmt = (
-        select(Order)
-        .options(
-            selectinload(Order.instrument)
-            .selectinload(Instrument.user)
-            .selectinload(User.settings)
-        )
-        .where(Order.deal_id == deal_id)
-    )
-    result = await db.execute(stmt)
-    order = result.scalar_one_or_none()
+    order = await find_order_by_deal_id(db, deal_id)
 
     if not order:
         raise HTTPException(
@@ -433,40 +752,75 @@ async def find_order_by_deal_id(db: AsyncSession, deal_id: str) -> Optional[Orde
     Returns:
         Order: The order object if found, None otherwise.
     """
-    stmt = (
-        select(Order)
-        .options(
-            selectinload(Order.instrument)
-            .selectinload(Instrument.user)
-            .selectinload(User.settings)
-        )
-        .where(Order.deal_id == deal_id)
-    )
-    result = await db.execute(stmt)
-    return result.scalar_one_or_none()
+    return await db.scalar(_GET_ORDER_BY_DEAL_ID, {"deal_id": deal_id})
+
+
+# The single app settings row is read on registration and admin user updates
+# but only changes when an admin edits it. Other processes don't see this
+# process's invalidation, so the TTL bounds how long they can lag behind.
+APP_SETTINGS_CACHE_TTL_SECONDS = 60
+_app_settings: Optional[Tuple[AppSettings, float]] = None
+_app_settings_lock: Optional[asyncio.Lock] = None
+_app_settings_lock_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_app_settings_lock() -> asyncio.Lock:
+    """Return the app settings lock for the running loop."""
+    global _app_settings_lock, _app_settings_lock_loop
+
+    loop = asyncio.get_running_loop()
+    if _app_settings_lock is None or _app_settings_lock_loop is not loop:
+        # Locks are tied to a loop; CLI commands and workers run their own
+        _app_settings_lock = asyncio.Lock()
+        _app_settings_lock_loop = loop
+    return _app_settings_lock
 
 
 async def get_app_settings(db: AsyncSession) -> AppSettings:
     """
     Retrieve the application settings.
 
+    The row is memoized per process (detached from the session) for
+    APP_SETTINGS_CACHE_TTL_SECONDS; call invalidate_app_settings after writes.
+
     Args:
         db (AsyncSession): The database session.
 
     Returns:
         AppSettings: The application settings object.
     """
-    stmt = select(AppSettings).where(AppSettings.id == 1)
-    result = await db.execute(stmt)
-    app_settings = result.scalar_one_or_none()
+    global _app_settings
+
+    cached = _app_settings
+    if cached is not None and cached[1] > time.monotonic():
+        return cached[0]
+
+    async with _get_app_settings_lock():
+        # Another caller may have loaded it while we waited
+        cached = _app_settings
+        if cached is not None and cached[1] > time.monotonic():
+            return cached[0]
+
+        app_settings = await db.get(AppSettings, 1, populate_existing=True)
+
+        if not app_settings:
+            app_settings = AppSettings()
+            db.add(app_settings)
+            await db.commit()
+
+        # Detach it so the shared copy never takes part in another flush
+        db.expunge(app_settings)
+        _app_settings = (
+            app_settings,
+            time.monotonic() + APP_SETTINGS_CACHE_TTL_SECONDS,
+        )
+        return app_settings
 
-    if not app_settings:
-        app_settings = AppSettings()
-        db.add(app_settings)
-        await db.commit()
-        await db.refresh(app_settings)
 
-    return app_settings
+def invalidate_app_settings() -> None:
+    """Drop the memoized app settings so the next read loads them again."""
+    global _app_settings
+    _app_settings = None
 
 
 async def universal_search_instruments(
@@ -487,50 +841,51 @@ async def universal_search_instruments(
         limit: Pagination limit
 
     Returns:
-        Dict with 'data' (list of instruments) and 'total_count'
+        Dict with 'data' (list of instrument rows, one attribute per column)
+        and 'total_count'
     """
     from sqlalchemy import or_, func
 
-    # Build the base query
-    search_query = (
-        select(Instrument)
-        .where(Instrument.user_id == user_id)
-        .where(
-            or_(
-                func.lower(Instrument.market_and_symbol).contains(func.lower(query)),
-                func.lower(Instrument.ig_epic).contains(func.lower(query)),
-                func.lower(Instrument.yahoo_symbol).contains(func.lower(query)),
-            )
-        )
-        .order_by(Instrument.updated_at.desc())
+    # Plain ILIKE on the columns (rather than lower() on both sides) is what
+    # the trigram indexes can serve
+    pattern = bindparam("pattern", f"%{query}%")
+    filters = (
+        Instrument.user_id == user_id,
+        or_(
+            Instrument.market_and_symbol.ilike(pattern),
+            Instrument.ig_epic.ilike(pattern),
+            Instrument.yahoo_symbol.ilike(pattern),
+        ),
     )
 
-    # Get total count
-    count_query = select(func.count()).select_from(
-        select(Instrument)
-        .where(Instrument.user_id == user_id)
-        .where(
-            or_(
-                func.lower(Instrument.market_and_symbol).contains(func.lower(query)),
-                func.lower(Instrument.ig_epic).contains(func.lower(query)),
-                func.lower(Instrument.yahoo_symbol).contains(func.lower(query)),
-            )
+    # The window count is computed before OFFSET/LIMIT, so the page and the
+    # total come back from one query. Results are only serialized, so plain
+    # column rows are returned instead of hydrating ORM instances.
+    search_query = (
+        select(
+            *Instrument.__table__.columns,
+            func.count().over().label("total_count"),
         )
-        .subquery()
+        .where(*filters)
+        .order_by(Instrument.updated_at.desc())
+        .offset(offset)
+        .limit(limit)
     )
 
-    total_result = await db.execute(count_query)
-    total_count = total_result.scalar()
-
-    # Apply pagination
-    search_query = search_query.offset(offset).limit(limit)
-
-    # Execute query
     result = await db.execute(search_query)
-    instruments = result.scalars().all()
+    rows = result.all()
+
+    if rows:
+        total_count = rows[0].total_count
+    elif offset:
+        # A page past the end has no rows to carry the total
+        count_query = select(func.count()).select_from(Instrument).where(*filters)
+        total_count = await db.scalar(count_query)
+    else:
+        total_count = 0
 
     return {
-        "data": instruments,
+        "data": rows,
         "total_count": total_count,
     }
 
@@ -554,8 +909,7 @@ async def get_most_recent_order_for_instrument(
         .order_by(Order.created_at.desc())
         .limit(1)
     )
-    result = await db.execute(stmt)
-    order = result.scalar_one_or_none()
+    order = await db.scalar(stmt)
 
     return order
 
@@ -596,26 +950,43 @@ async def get_orders_for_user(db: AsyncSession, user_id: uuid.UUID) -> list[Orde
     return orders
 
 
-async def get_all_orders_with_deal_id(db: AsyncSession) -> list[Order]:
+ORDERS_WITH_DEAL_ID_BATCH_SIZE = 500
+
+
+async def get_orders_with_deal_id_batch(
+    db: AsyncSession,
+    after_id: Optional[uuid.UUID] = None,
+    limit: int = ORDERS_WITH_DEAL_ID_BATCH_SIZE,
+) -> List[Order]:
     """
-    Retrieve all orders that have a deal_id assigned.
+    Retrieve the next batch of orders that have a deal_id assigned.
+
+    Orders are keyset-paginated by id so callers can walk every order in
+    short-lived sessions instead of holding one cursor open for the whole run.
 
     Args:
         db (AsyncSession): The database session.
+        after_id (Optional[uuid.UUID]): The last order id from the previous
+            batch, or None for the first batch.
+        limit (int): The maximum number of orders to return.
 
     Returns:
-        List[Order]: A list of order objects with deal_id.
+        List[Order]: The orders with deal_id, with user, settings and
+            instrument loaded.
     """
     stmt = (
         select(Order)
         .options(selectinload(Order.user).selectinload(User.settings))
         .options(selectinload(Order.instrument))
         .where(Order.deal_id.is_not(None))
+        .order_by(Order.id)
+        .limit(limit)
     )
-    result = await db.execute(stmt)
-    orders = result.scalars().all()
+    if after_id is not None:
+        stmt = stmt.where(Order.id > after_id)
 
-    return orders
+    result = await db.scalars(stmt)
+    return result.all()
 
 
 async def get_all_admin_users(db: AsyncSession) -> list[User]:
@@ -628,9 +999,8 @@ async def get_all_admin_users(db: AsyncSession) -> list[User]:
     Returns:
         List[User]: A list of admin user objects.
     """
-    stmt = select(User).where(User.role == UserRole.ADMIN)
-    result = await db.execute(stmt)
-    users = result.scalars().all()
+    result = await db.scalars(_GET_ADMIN_USERS, {"role": UserRole.ADMIN})
+    users = result.all()
 
     return users
 
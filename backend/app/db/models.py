@@ -1,15 +1,44 @@
 import datetime
 import uuid
 from decimal import Decimal
+from enum import Enum as PyEnum
 from typing import List, Optional
 
 from app.db.enums import LogType, UserRole, UserSettingsMode, UserSettingsOrderType
-from app.services.utils import generate_deal_reference, generate_webhook_secret
-from sqlalchemy import JSON, DateTime, Enum, ForeignKey, String, Text
+from app.services.utils import (
+    generate_deal_reference,
+    generate_webhook_secret,
+    webhook_secret_lookup_hash,
+)
+from sqlalchemy import (
+    DDL,
+    JSON,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Index,
+    LargeBinary,
+    String,
+    Text,
+    event,
+    text,
+)
 from sqlalchemy.ext.asyncio import AsyncAttrs
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 
+def _enum_column_type(enum_class: type[PyEnum]) -> Enum:
+    """Store an enum as VARCHAR + CHECK rather than a native Postgres ENUM."""
+    # Adding a member then only swaps a constraint instead of an ALTER TYPE
+    return Enum(
+        enum_class,
+        native_enum=False,
+        create_constraint=True,
+        length=32,
+        name=f"ck_{enum_class.__name__.lower()}",
+    )
+
+
 class Base(AsyncAttrs, DeclarativeBase):
     pass
 
@@ -44,7 +73,7 @@ class User(BaseDBModel):
         Text, nullable=True, unique=True
     )
     role: Mapped[UserRole] = mapped_column(
-        Enum(UserRole), nullable=False, default=UserRole.USER
+        _enum_column_type(UserRole), nullable=False, default=UserRole.USER
     )
     settings: Mapped["UserSettings"] = relationship(
         "UserSettings", back_populates="user", cascade="all, delete-orphan"
@@ -77,7 +106,7 @@ class Log(BaseDBModel):
     message: Mapped[str] = mapped_column(Text, nullable=False)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     type: Mapped[LogType] = mapped_column(
-        Enum(LogType), nullable=False, default=LogType.UNSPECIFIED
+        _enum_column_type(LogType), nullable=False, default=LogType.UNSPECIFIED
     )
     identifier: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     user: Mapped[User] = relationship("User", back_populates="logs", uselist=False)
@@ -86,6 +115,28 @@ class Log(BaseDBModel):
 
 class Instrument(BaseDBModel):
     __tablename__ = "instruments"
+    __table_args__ = (
+        # Covers market_and_symbol so epic -> symbol lookups are index-only
+        Index(
+            "ix_instruments_user_id_ig_epic",
+            "user_id",
+            "ig_epic",
+            postgresql_include=["market_and_symbol"],
+        ),
+        Index(
+            "ix_instruments_user_id_market_and_symbol", "user_id", "market_and_symbol"
+        ),
+        # Trigram indexes back the substring (ILIKE '%...%') instrument search
+        *(
+            Index(
+                f"ix_instruments_{column}_trgm",
+                column,
+                postgresql_using="gin",
+                postgresql_ops={column: "gin_trgm_ops"},
+            )
+            for column in ("market_and_symbol", "ig_epic", "yahoo_symbol")
+        ),
+    )
 
     user_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("users.id", ondelete="CASCADE"), nullable=False
@@ -123,15 +174,47 @@ class Instrument(BaseDBModel):
     )
 
 
+# The trigram indexes need pg_trgm; create_all builds them on a fresh database
+event.listen(
+    Instrument.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
+
+
+def _lookup_hash_default(secret_column: str):
+    """Default a secret's lookup hash from the secret inserted alongside it."""
+
+    def default(context):
+        secret = context.get_current_parameters().get(secret_column)
+        return webhook_secret_lookup_hash(secret)
+
+    return default
+
+
 class UserSettings(BaseDBModel):
     __tablename__ = "user_settings"
+    __table_args__ = (
+        Index(
+            "ix_user_settings_demo_webhook_secret_hash",
+            "demo_webhook_secret_hash",
+            postgresql_using="hash",
+        ),
+        Index(
+            "ix_user_settings_live_webhook_secret_hash",
+            "live_webhook_secret_hash",
+            postgresql_using="hash",
+        ),
+    )
 
     user_id: Mapped[uuid.UUID] = mapped_column(
-        ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+        ForeignKey("users.id", ondelete="CASCADE"), nullable=False, unique=True
     )
     user: Mapped[User] = relationship("User", back_populates="settings", uselist=False)
     mode: Mapped[UserSettingsMode] = mapped_column(
-        Enum(UserSettingsMode), nullable=False, default=UserSettingsMode.DEMO
+        _enum_column_type(UserSettingsMode),
+        nullable=False,
+        default=UserSettingsMode.DEMO,
     )
     demo_api_key: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     demo_username: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
@@ -139,6 +222,13 @@ class UserSettings(BaseDBModel):
     demo_webhook_secret: Mapped[Optional[str]] = mapped_column(
         Text, nullable=True, default=generate_webhook_secret
     )
+    # Must stay after demo_webhook_secret so its default sees the generated secret
+    demo_webhook_secret_hash: Mapped[Optional[bytes]] = mapped_column(
+        LargeBinary,
+        nullable=True,
+        default=_lookup_hash_default("demo_webhook_secret"),
+        comment="Lookup key for demo_webhook_secret",
+    )
     demo_account_id: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     live_api_key: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     live_username: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
@@ -146,9 +236,18 @@ class UserSettings(BaseDBModel):
     live_webhook_secret: Mapped[Optional[str]] = mapped_column(
         Text, nullable=True, default=generate_webhook_secret
     )
+    # Must stay after live_webhook_secret so its default sees the generated secret
+    live_webhook_secret_hash: Mapped[Optional[bytes]] = mapped_column(
+        LargeBinary,
+        nullable=True,
+        default=_lookup_hash_default("live_webhook_secret"),
+        comment="Lookup key for live_webhook_secret",
+    )
     live_account_id: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     order_type: Mapped[UserSettingsOrderType] = mapped_column(
-        Enum(UserSettingsOrderType), nullable=False, default=UserSettingsOrderType.LIMIT
+        _enum_column_type(UserSettingsOrderType),
+        nullable=False,
+        default=UserSettingsOrderType.LIMIT,
     )
     maximum_order_age_in_minutes: Mapped[int] = mapped_column(
         nullable=False, default=1, comment="Maximum age of an order in minutes"
@@ -192,6 +291,15 @@ class UserSettings(BaseDBModel):
 
 class Order(BaseDBModel):
     __tablename__ = "orders"
+    __table_args__ = (
+        # Only open orders are looked up by user, so only they are indexed
+        Index(
+            "ix_orders_user_id_open",
+            "user_id",
+            postgresql_where=text("is_open"),
+        ),
+        Index("ix_orders_instrument_id_created_at", "instrument_id", "created_at"),
+    )
 
     instrument_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("instruments.id", ondelete="CASCADE"), nullable=False, unique=False
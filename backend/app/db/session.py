@@ -1,11 +1,74 @@
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker
+import asyncio
+import uuid
+from contextlib import AsyncExitStack
+
+from sqlalchemy import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
 from app.config import settings
 
-engine = create_async_engine(settings.DATABASE_URL, echo=True)
+# asyncpg prepared statements are cached per connection; the default of 100
+# is easily outgrown once every query shape the app runs is counted
+PREPARED_STATEMENT_CACHE_SIZE = 1024
+# Compiled SQL cache entries per engine; the default of 500 is shared by every
+# statement shape (including each lambda statement and ORM loader variant)
+QUERY_CACHE_SIZE = 1200
+# Recycle before Postgres or a proxy in between drops idle connections
+POOL_RECYCLE_SECONDS = 3600
+
+# The asyncpg options don't apply to the SQLite URL used for local setups
+connect_args = {}
+if make_url(settings.DATABASE_URL).get_backend_name() == "postgresql":
+    connect_args = {
+        "prepared_statement_cache_size": PREPARED_STATEMENT_CACHE_SIZE,
+        # Our queries are short lookups; JIT compilation only adds latency
+        "server_settings": {"jit": "off"},
+    }
 
-async_session = sessionmaker(
+if settings.DATABASE_EXTERNAL_POOL:
+    # PgBouncer in transaction mode hands each transaction whichever server
+    # connection is free, so statements prepared on one aren't there on the
+    # next: disable both statement caches and give every statement a unique
+    # name. Connections are opened per checkout and PgBouncer does the pooling.
+    connect_args.update(
+        {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4()}__",
+        }
+    )
+    pool_args = {"poolclass": NullPool}
+else:
+    pool_args = {
+        "pool_size": settings.DATABASE_POOL_SIZE,
+        "max_overflow": settings.DATABASE_MAX_OVERFLOW,
+        "pool_pre_ping": True,
+        "pool_recycle": POOL_RECYCLE_SECONDS,
+    }
+
+engine = create_async_engine(
+    settings.DATABASE_URL,
+    # Logging every statement is a debugging aid, not something to pay for
+    # on each query in production
+    echo=settings.DEBUG,
+    query_cache_size=QUERY_CACHE_SIZE,
+    connect_args=connect_args,
+    **pool_args,
+)
+
+async_session = async_sessionmaker(
     bind=engine,
     expire_on_commit=False,
     class_=AsyncSession,
 )
+
+
+async def warm_pool(size: int = settings.DATABASE_POOL_SIZE) -> None:
+    """Open `size` connections up front so early requests don't pay for them."""
+    if settings.DATABASE_EXTERNAL_POOL:
+        # Nothing is kept open locally; PgBouncer holds the warm connections
+        return
+    async with AsyncExitStack() as stack:
+        await asyncio.gather(
+            *(stack.enter_async_context(engine.connect()) for _ in range(size))
+        )
@@ -13,24 +13,29 @@ from app.api.routes import (
     logs,
     stats,
 )
-from app.config import LOGGING_CONFIG, settings
+from app.config import build_logging_config, settings
 from app.db.models import Base
-from app.db.session import engine
+from app.db.session import engine, warm_pool
+from app.services.logging.buffer import flush_logs
 from app.api.exceptions import register_exception_handlers
 from fastapi import APIRouter, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-logging.config.dictConfig(LOGGING_CONFIG)
 logger = logging.getLogger("app")
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    logging.config.dictConfig(build_logging_config())
+
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
+    await warm_pool()
+
     yield
 
+    await flush_logs()
     await engine.dispose()
 
 
@@ -1,5 +1,4 @@
 import asyncio
-from concurrent.futures import ThreadPoolExecutor, as_completed
 import logging
 import uuid
 from collections import defaultdict
@@ -84,7 +83,7 @@ def fetch_dividend_dates_in_batches(
     max_workers: int = 500,
 ) -> List[Tuple[uuid.UUID, Optional[datetime]]]:
     """
-    Fetch dividend dates concurrently using ThreadPoolExecutor.
+    Fetch dividend dates concurrently, once per distinct Yahoo symbol.
 
     :param instruments: List of instruments (id, yahoo_symbol, user_id, market_and_symbol)
     :param max_workers: Number of threads to run in parallel
@@ -93,36 +92,18 @@ def fetch_dividend_dates_in_batches(
     if not instruments:
         return []
 
-    base_client = YahooFinanceClient()
-    results: List[Tuple[uuid.UUID, Optional[datetime]]] = []
+    client = YahooFinanceClient()
+    dividend_dates = client.get_next_dividend_dates(
+        [symbol for _, symbol, *_ in instruments], max_workers=max_workers
+    )
 
-    # Blocking function that fetches one instrument
-    def fetch_sync(
-        inst_id: uuid.UUID, symbol: str
-    ) -> Tuple[uuid.UUID, Optional[datetime]]:
-        try:
-            dt = base_client.get_next_dividend_date(symbol)
-            if dt and dt.tzinfo is None:
-                dt = dt.replace(tzinfo=timezone.utc)
-            logger.info(f"Fetched dividend date for {symbol}: {dt}")
-            return inst_id, dt
-        except Exception as exc:
-            logger.error(f"Failed to fetch dividend date for {symbol}: {exc}")
-            return inst_id, None
-
-    # Use ThreadPoolExecutor to fetch in parallel
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = {
-            executor.submit(fetch_sync, inst_id, symbol): inst_id
-            for inst_id, symbol, *_ in instruments
-        }
-        for future in as_completed(futures):
-            try:
-                results.append(future.result())
-            except Exception as exc:
-                inst_id = futures[future]
-                logger.error(f"Future failed for instrument {inst_id}: {exc}")
-                results.append((inst_id, None))
+    results: List[Tuple[uuid.UUID, Optional[datetime]]] = []
+    for inst_id, symbol, *_ in instruments:
+        dt = dividend_dates.get(symbol)
+        if dt and dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        logger.info(f"Fetched dividend date for {symbol}: {dt}")
+        results.append((inst_id, dt))
 
     return results
 
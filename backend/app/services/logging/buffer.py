@@ -0,0 +1,92 @@
+"""
+Buffered writes for database log entries.
+
+Entries are queued in memory and written by a background task in batches of
+up to LOG_BATCH_SIZE, or whatever arrived within LOG_FLUSH_INTERVAL_SECONDS,
+so a burst of log calls costs one transaction instead of one per entry.
+"""
+
+import asyncio
+import logging
+from typing import List, Optional
+
+from app.db.crud import create_logs
+from app.db.deps import get_db_context
+
+logger = logging.getLogger(__name__)
+
+LOG_BATCH_SIZE = 100
+LOG_FLUSH_INTERVAL_SECONDS = 0.5
+LOG_QUEUE_MAX_SIZE = 10_000
+
+_log_queue: Optional[asyncio.Queue] = None
+_flusher: Optional[asyncio.Task] = None
+_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_queue() -> asyncio.Queue:
+    """Return the queue for the running loop, starting its flusher if needed."""
+    global _log_queue, _flusher, _loop
+
+    loop = asyncio.get_running_loop()
+    if _log_queue is None or _loop is not loop:
+        # Queues and tasks are tied to a loop; CLI commands run a fresh one
+        _log_queue = asyncio.Queue(maxsize=LOG_QUEUE_MAX_SIZE)
+        _flusher = None
+        _loop = loop
+
+    if _flusher is None or _flusher.done():
+        _flusher = loop.create_task(_flush_forever(_log_queue))
+
+    return _log_queue
+
+
+async def _write_batch(batch: List[dict]) -> None:
+    try:
+        async with get_db_context() as db:
+            await create_logs(db, batch)
+    except Exception:
+        if len(batch) == 1:
+            logger.exception(
+                "Failed to write log entry %r for user %s",
+                batch[0].get("message"),
+                batch[0].get("user_id"),
+            )
+            return
+
+        # Bisect so one bad row (e.g. a since-deleted user) doesn't cost the rest
+        logger.warning("Failed to write %d log entries, splitting batch", len(batch))
+        middle = len(batch) // 2
+        await _write_batch(batch[:middle])
+        await _write_batch(batch[middle:])
+
+
+async def _flush_forever(queue: asyncio.Queue) -> None:
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = [await queue.get()]
+        deadline = loop.time() + LOG_FLUSH_INTERVAL_SECONDS
+
+        while len(batch) < LOG_BATCH_SIZE:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), timeout))
+            except TimeoutError:
+                break
+
+        await _write_batch(batch)
+        for _ in batch:
+            queue.task_done()
+
+
+async def enqueue_log(entry: dict) -> None:
+    """Queue a log row (Log column values) to be written with the next batch."""
+    await _get_queue().put(entry)
+
+
+async def flush_logs() -> None:
+    """Wait until every queued log entry has been written."""
+    if _log_queue is not None and _loop is asyncio.get_running_loop():
+        await _log_queue.join()
@@ -1,8 +1,9 @@
 import uuid
+from datetime import datetime, timezone
 from typing import Literal, Optional
 
-from app.db.crud import log_message as log_message_to_db
 from app.db.enums import LogType
+from app.services.logging.buffer import enqueue_log
 
 LOG_TYPE = Literal[
     "unspecified", "authentication", "alert", "trade", "order", "error", "admin"
@@ -18,7 +19,7 @@ async def log_message(
     identifier: Optional[str] = None,
 ) -> None:
     """
-    Logs a message to the database.
+    Queues a message to be written to the database with the next log batch.
 
     Args:
         message (str): The log message.
@@ -30,4 +31,18 @@ async def log_message(
     except ValueError:
         enum_type = LogType.UNSPECIFIED
 
-    await log_message_to_db(message, description, enum_type, user_id, extra, identifier)
+    # Stamp the row now; it may reach the database a little later
+    now = datetime.now(timezone.utc)
+    await enqueue_log(
+        {
+            "id": uuid.uuid4(),
+            "created_at": now,
+            "updated_at": now,
+            "message": message,
+            "description": description,
+            "type": enum_type,
+            "extra": extra,
+            "user_id": user_id,
+            "identifier": identifier,
+        }
+    )
@@ -14,7 +14,7 @@ from app.clients.ig.types import (
 from app.clients.ig.exceptions import MissingCredentialsError
 from app.db.deps import get_db_context
 from app.db.crud import (
-    get_order_by_id,
+    find_order_by_id,
     update_order,
     delete_order,
     get_user_by_id,
@@ -41,7 +41,7 @@ async def confirm_deal_reference_for_order(
 
     try:
         async with get_db_context() as db:
-            order = await get_order_by_id(db, order_id)
+            order = await find_order_by_id(db, order_id)
             if not order:
                 raise OrderNotFoundError(f"Order {order_id} not found in database")
 
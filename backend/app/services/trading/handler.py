@@ -1,11 +1,5 @@
 from app.api.schemas.instruments import InstrumentRead
 from app.api.schemas.webhook import WebhookPayload
-from app.db.crud import (
-    get_instrument_by_market_and_symbol,
-    get_user_by_webhook_secret,
-    update_instrument,
-)
-from app.db.deps import get_db_context
 from app.services.logging import log_message
 from app.services.trading.calculation_helpers import *
 from app.services.trading.payload_parser import (
@@ -17,20 +11,19 @@ from app.services.trading.trade_executor import create_order
 
 
 async def handle_alert(payload: WebhookPayload):
-    is_valid, _ = await validate_webhook_payload(payload)
+    # Serialized once and shared by every log entry about this payload
+    payload_data = payload.model_dump(mode="json")
+    is_valid, _, user, instrument = await validate_webhook_payload(
+        payload, payload_data
+    )
 
     if not is_valid:
         # the validator already logs the error
         return
 
-    raw_alert = await parse_webhook_payload_to_trading_view_alert(payload)
-
-    async with get_db_context() as db:
-        user = await get_user_by_webhook_secret(db, payload.secret)
-        instrument = await get_instrument_by_market_and_symbol(
-            db, raw_alert.market_and_symbol, user
-        )
+    raw_alert = parse_webhook_payload_to_trading_view_alert(payload)
     alert = await normalize_prices(raw_alert, instrument)
+    alert_data = alert.model_dump(mode="json")
 
     await log_message(
         "Received valid webhook payload",
@@ -38,7 +31,7 @@ async def handle_alert(payload: WebhookPayload):
         "alert",
         user.id,
         {
-            "payload": payload.model_dump(mode="json"),
+            "payload": payload_data,
         },
     )
 
@@ -48,7 +41,7 @@ async def handle_alert(payload: WebhookPayload):
         "alert",
         user.id,
         {
-            "alert": alert.model_dump(mode="json"),
+            "alert": alert_data,
         },
     )
 
@@ -76,7 +69,7 @@ async def handle_alert(payload: WebhookPayload):
             "error",
             user.id,
             {
-                "alert": alert.model_dump(mode="json"),
+                "alert": alert_data,
                 "instrument": InstrumentRead.model_validate(instrument).model_dump(
                     mode="json"
                 ),
@@ -1,32 +1,41 @@
 import logging
 from decimal import Decimal
-from pydantic import BaseModel
+from typing import NamedTuple
+
+from pydantic import TypeAdapter
 
 from app.api.schemas.alert import TradingViewAlert
 from app.api.schemas.webhook import WebhookPayload
 
 logger = logging.getLogger(__name__)
 
+# Built once at import and reused for every alert
+TRADING_VIEW_ALERT_ADAPTER = TypeAdapter(TradingViewAlert)
+
 
-async def parse_webhook_payload_to_trading_view_alert(
+def parse_webhook_payload_to_trading_view_alert(
     payload: WebhookPayload,
 ) -> TradingViewAlert:
     """Parse a WebhookPayload into a TradingViewAlert by extracting ATRs from the message field."""
 
     parsed = parse_message_fields(payload.message)
 
-    return TradingViewAlert(
-        market_and_symbol=parsed.market_and_symbol,
-        direction=parsed.direction,
-        message=payload.message,
-        secret=payload.secret,
-        timestamp=payload.timestamp,
-        open_price=parsed.open_price,
-        atrs=parsed.atrs,
+    return TRADING_VIEW_ALERT_ADAPTER.validate_python(
+        {
+            "market_and_symbol": parsed.market_and_symbol,
+            "direction": parsed.direction,
+            "message": payload.message,
+            "secret": payload.secret,
+            "timestamp": payload.timestamp,
+            "open_price": parsed.open_price,
+            "atrs": parsed.atrs,
+        }
     )
 
 
-class ParsedMessageFields(BaseModel):
+class ParsedMessageFields(NamedTuple):
+    # A plain tuple: the fields are already typed here, so there's nothing for
+    # a pydantic model to validate on each alert
     direction: str
     open_price: Decimal
     atrs: list[Decimal]
@@ -42,28 +51,23 @@ def parse_message_fields(message: str) -> ParsedMessageFields:
             "Message format is incorrect. Expected at least 13 parts (direction, open price, 10 ATRs, etc.)"
         )
 
+    market_and_symbol_raw, direction_raw, open_price_raw = parts[:3]
+
     # Market and symbol
-    market_and_symbol = parts[0].strip().upper()
+    market_and_symbol = market_and_symbol_raw.strip().upper()
 
     # Direction
-    direction_raw = parts[1].strip().upper()
-    direction = "SELL" if direction_raw == "UP" else "BUY"
+    direction = "SELL" if direction_raw.strip().upper() == "UP" else "BUY"
 
     # Open price
     try:
-        parts[2] = parts[2].replace(",", "")
-        open_price = Decimal(parts[2].strip())
+        open_price = Decimal(open_price_raw.replace(",", "").strip())
     except (ValueError, TypeError) as e:
         raise ValueError(f"Failed to parse open price from message: {e}")
 
-    # ATRs
-    atrs_raw = parts[-10:]
-    if len(atrs_raw) != 10:
-        raise ValueError(
-            f"Message format is incorrect. Expected exactly 10 ATR values, got {len(atrs_raw)}."
-        )
+    # ATRs are the last 10 parts; the length check above guarantees there are 10
     try:
-        atrs = [Decimal(atr.strip()) for atr in atrs_raw if atr.strip()]
+        atrs = [Decimal(atr) for atr in map(str.strip, parts[-10:]) if atr]
     except (ValueError, TypeError) as e:
         raise ValueError(f"Failed to parse ATRs from message: {e}")
 
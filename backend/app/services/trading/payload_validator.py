@@ -1,3 +1,4 @@
+import asyncio
 from datetime import date, datetime, timedelta, timezone
 from enum import Enum
 from typing import Optional, Tuple
@@ -44,9 +45,17 @@ async def _log_validation_error(
     user_id: int,
     payload: WebhookPayload,
     extra_data: dict = None,
+    payload_data: Optional[dict] = None,
 ) -> None:
-    """Helper function to log validation errors consistently."""
-    log_data = {"payload": payload.model_dump(mode="json")}
+    """
+    Helper function to log validation errors consistently.
+
+    Pass `payload_data` when logging the same payload several times so it is
+    only serialized once.
+    """
+    if payload_data is None:
+        payload_data = payload.model_dump(mode="json")
+    log_data = {"payload": payload_data}
     if extra_data:
         log_data.update(extra_data)
 
@@ -54,7 +63,7 @@ async def _log_validation_error(
 
 
 async def _validate_user_exists(
-    payload: WebhookPayload, db
+    payload: WebhookPayload, db, payload_data: Optional[dict] = None
 ) -> Tuple[bool, Optional[str], Optional[User]]:
     """Validate that a user exists for the given webhook secret."""
     user = await get_user_by_webhook_secret(db, payload.secret)
@@ -69,6 +78,7 @@ async def _validate_user_exists(
                 admin.id,
                 payload,
                 {"received_secret": payload.secret},
+                payload_data=payload_data,
             )
         return False, ValidationError.INVALID_WEBHOOK_SECRET.value, None
 
@@ -76,7 +86,7 @@ async def _validate_user_exists(
 
 
 async def _validate_webhook_secret(
-    payload: WebhookPayload, user: User
+    payload: WebhookPayload, user: User, payload_data: Optional[dict] = None
 ) -> Tuple[bool, Optional[str]]:
     """Validate webhook secret matches user's configured secret."""
     expected_secret = (
@@ -104,6 +114,7 @@ async def _validate_webhook_secret(
                 "expected_secret": expected_secret,
                 "received_secret": payload.secret,
             },
+            payload_data=payload_data,
         )
 
         return False, error_code
@@ -112,7 +123,7 @@ async def _validate_webhook_secret(
 
 
 async def _validate_alert_age(
-    payload: WebhookPayload, user: User
+    payload: WebhookPayload, user: User, payload_data: Optional[dict] = None
 ) -> Tuple[bool, Optional[str]]:
     """Validate alert is not too old based on user settings."""
     if not user.settings.enforce_maximum_alert_age_in_seconds:
@@ -132,6 +143,7 @@ async def _validate_alert_age(
                 "maximum_alert_age_in_seconds": user.settings.maximum_alert_age_in_seconds,
                 "payload_age_seconds": payload_age_seconds,
             },
+            payload_data=payload_data,
         )
 
         return False, ValidationError.MAX_ALERT_AGE_EXCEEDED.value
@@ -140,7 +152,7 @@ async def _validate_alert_age(
 
 
 async def _validate_instrument_exists(
-    payload: WebhookPayload, user: User, db
+    payload: WebhookPayload, user: User, db, payload_data: Optional[dict] = None
 ) -> Tuple[bool, Optional[str], Optional[Instrument]]:
     """Validate that the instrument exists in the database."""
 
@@ -154,6 +166,7 @@ async def _validate_instrument_exists(
             user.id,
             payload,
             {"market_and_symbol": market_and_symbol},
+            payload_data=payload_data,
         )
 
         return False, ValidationError.INSTRUMENT_NOT_FOUND.value, None
@@ -162,7 +175,11 @@ async def _validate_instrument_exists(
 
 
 async def _validate_trade_cooldown_timing(
-    payload: WebhookPayload, user: User, instrument: Instrument, db
+    payload: WebhookPayload,
+    user: User,
+    instrument: Instrument,
+    db,
+    payload_data: Optional[dict] = None,
 ) -> Tuple[bool, Optional[str]]:
     """Validate that enough time has passed since the last alert was received for this instrument."""
 
@@ -202,6 +219,7 @@ async def _validate_trade_cooldown_timing(
                 "hours_since_last_alert": hours_since_last_alert,
                 "minimum_hours_required": user.settings.instrument_trade_cooldown_period_in_hours,
             },
+            payload_data=payload_data,
         )
 
         return False, ValidationError.ORDER_CREATION_TOO_SOON.value
@@ -214,6 +232,7 @@ async def _validate_dividend_date(
     user_id: int,
     avoid_dividend_dates: bool,
     next_dividend_date: Optional[datetime],
+    payload_data: Optional[dict] = None,
 ) -> Tuple[bool, Optional[str]]:
     """Validate that trading is allowed on dividend dates."""
     if not avoid_dividend_dates:
@@ -229,6 +248,7 @@ async def _validate_dividend_date(
             user_id,
             payload,
             {"dividend_date": next_dividend_date.isoformat()},
+            payload_data=payload_data,
         )
 
         return False, ValidationError.ALERT_ON_DIVIDEND_DATE.value
@@ -244,6 +264,7 @@ async def _validate_position_or_working_order_does_not_exist(
     prevent_duplicate_positions_for_instrument: bool,
     positions_data,
     working_orders_data,
+    payload_data: Optional[dict] = None,
 ) -> Tuple[bool, Optional[str]]:
     """Validate that a position or working order does not already exist for the instrument's IG epic"""
     if not instrument_ig_epic:
@@ -259,7 +280,8 @@ async def _validate_position_or_working_order_does_not_exist(
 
     # Check if any existing position matches the instrument's IG epic
     for position_data in positions_data:
-        if position_data.market.epic == instrument_ig_epic:
+        if position_data["market"].get("epic") == instrument_ig_epic:
+            position = position_data["position"]
             await _log_validation_error(
                 "Position already exists for instrument",
                 "Alert has been rejected because a position already exists for this instrument",
@@ -268,20 +290,19 @@ async def _validate_position_or_working_order_does_not_exist(
                 {
                     "instrument_id": str(instrument_id),
                     "ig_epic": instrument_ig_epic,
-                    "existing_deal_id": position_data.position.deal_id,
-                    "existing_position_size": str(position_data.position.size),
-                    "existing_position_direction": position_data.position.direction,
+                    "existing_deal_id": position.get("dealId"),
+                    "existing_position_size": str(position.get("size")),
+                    "existing_position_direction": position.get("direction"),
                 },
+                payload_data=payload_data,
             )
 
             return False, ValidationError.POSITION_ALREADY_EXISTS.value
 
     # Check if any working order exists for the same instrument
     for working_order in working_orders_data:
-        if (
-            working_order.working_order_data
-            and working_order.working_order_data.epic == instrument_ig_epic
-        ):
+        working_order_data = working_order.get("workingOrderData")
+        if working_order_data and working_order_data.get("epic") == instrument_ig_epic:
             await _log_validation_error(
                 "Working order already exists for instrument",
                 "Alert has been rejected because a working order already exists for this instrument",
@@ -290,13 +311,12 @@ async def _validate_position_or_working_order_does_not_exist(
                 {
                     "instrument_id": str(instrument_id),
                     "ig_epic": instrument_ig_epic,
-                    "existing_deal_id": working_order.working_order_data.deal_id,
-                    "existing_order_size": str(
-                        working_order.working_order_data.order_size
-                    ),
-                    "existing_order_direction": working_order.working_order_data.direction,
-                    "existing_order_type": working_order.working_order_data.order_type,
+                    "existing_deal_id": working_order_data.get("dealId"),
+                    "existing_order_size": str(working_order_data.get("orderSize")),
+                    "existing_order_direction": working_order_data.get("direction"),
+                    "existing_order_type": working_order_data.get("orderType"),
                 },
+                payload_data=payload_data,
             )
 
             return False, ValidationError.WORKING_ORDER_ALREADY_EXISTS.value
@@ -310,6 +330,7 @@ async def _validate_maximum_pending_orders(
     maximum_open_positions: int,
     payload: WebhookPayload,
     working_orders_data,
+    payload_data: Optional[dict] = None,
 ) -> Tuple[bool, Optional[str]]:
     """Validate that the user has not exceeded their maximum pending orders."""
     if not enforce_maximum_open_positions:
@@ -331,6 +352,7 @@ async def _validate_maximum_pending_orders(
                 "maximum_open_positions": maximum_open_positions,
                 "current_pending_orders_count": pending_orders_count,
             },
+            payload_data=payload_data,
         )
 
         return False, "MAXIMUM_PENDING_ORDERS_EXCEEDED"
@@ -345,6 +367,7 @@ async def _validate_maximum_open_positions_and_pending_orders(
     maximum_open_positions_and_pending_orders: int,
     positions_data,
     working_orders_data,
+    payload_data: Optional[dict] = None,
 ) -> Tuple[bool, Optional[str]]:
     """Validate that the user has not exceeded their maximum open positions and pending orders combined."""
     if not enforce_maximum_open_positions_and_pending_orders:
@@ -370,6 +393,7 @@ async def _validate_maximum_open_positions_and_pending_orders(
                 "current_pending_orders": pending_orders_count,
                 "total_count": total_count,
             },
+            payload_data=payload_data,
         )
 
         return (
@@ -381,7 +405,7 @@ async def _validate_maximum_open_positions_and_pending_orders(
 
 
 async def _fetch_ig_positions_and_orders(
-    user: User, payload: WebhookPayload
+    user: User, payload: WebhookPayload, payload_data: Optional[dict] = None
 ) -> Tuple[Optional[list], Optional[list]]:
     """
     Fetch positions and working orders from IG API once.
@@ -392,10 +416,18 @@ async def _fetch_ig_positions_and_orders(
     """
     try:
         ig_client = await IGClient.create_for_user(user)
-        positions_response = await ig_client.get_positions()
-        working_orders_response = await ig_client.get_working_orders()
+        # Independent reads, so overlap them; both still pass the user's limiter.
+        # Exceptions are collected so neither request is left running unobserved.
+        positions, working_orders = await asyncio.gather(
+            ig_client.get_positions_fast(),
+            ig_client.get_working_orders_fast(),
+            return_exceptions=True,
+        )
+        for result in (positions, working_orders):
+            if isinstance(result, BaseException):
+                raise result
 
-        return positions_response.positions, working_orders_response.working_orders
+        return positions, working_orders
 
     except (IGAPIError, IGAuthenticationError) as e:
         # If we can't connect to IG API, log the error but allow the trade to proceed
@@ -409,6 +441,7 @@ async def _fetch_ig_positions_and_orders(
                 "error_type": type(e).__name__,
                 "error_message": str(e),
             },
+            payload_data=payload_data,
         )
 
         return None, None
@@ -416,43 +449,59 @@ async def _fetch_ig_positions_and_orders(
 
 async def validate_webhook_payload(
     payload: WebhookPayload,
-) -> Tuple[bool, Optional[str]]:
+    payload_data: Optional[dict] = None,
+) -> Tuple[bool, Optional[str], Optional[User], Optional[Instrument]]:
     """
     Validate incoming webhook payload against various business rules.
 
+    The user and instrument loaded for validation are handed back so the caller
+    doesn't have to fetch them again.
+
     Returns:
-        Tuple[bool, Optional[str]]: (is_valid, error_code)
+        Tuple[bool, Optional[str], Optional[User], Optional[Instrument]]:
+            (is_valid, error_code, user, instrument); user and instrument are
+            only set when the payload is valid
+
+    Pass `payload_data` if the caller already has the payload's JSON dump, so
+    it isn't serialized again for each log entry.
     """
+    if payload_data is None:
+        payload_data = payload.model_dump(mode="json")
+
     # Phase 1: Perform all DB-dependent validations, then release the session
     async with get_db_context() as db:
         # Validate user exists
-        is_valid, error_code, user = await _validate_user_exists(payload, db)
+        is_valid, error_code, user = await _validate_user_exists(
+            payload, db, payload_data
+        )
         if not is_valid:
-            return is_valid, error_code
+            return is_valid, error_code, None, None
 
         # Validate webhook secret
-        is_valid, error_code = await _validate_webhook_secret(payload, user)
+        is_valid, error_code = await _validate_webhook_secret(
+            payload, user, payload_data
+        )
         if not is_valid:
-            return is_valid, error_code
+            return is_valid, error_code, None, None
 
         # Validate alert age
-        is_valid, error_code = await _validate_alert_age(payload, user)
+        is_valid, error_code = await _validate_alert_age(payload, user, payload_data)
         if not is_valid:
-            return is_valid, error_code
+            return is_valid, error_code, None, None
 
         # Validate instrument exists
         is_valid, error_code, instrument = await _validate_instrument_exists(
-            payload, user, db
+            payload, user, db, payload_data
         )
         if not is_valid:
-            return is_valid, error_code
+            return is_valid, error_code, None, None
 
         # Validate trade cooldown timing (checks instrument's last alert received timestamp)
         is_valid, error_code = await _validate_trade_cooldown_timing(
-            payload, user, instrument, db
+            payload, user, instrument, db, payload_data
         )
         if not is_valid:
-            return is_valid, error_code
+            return is_valid, error_code, None, None
 
         # Extract scalar values needed after the DB session closes
         user_id = user.id
@@ -474,7 +523,7 @@ async def validate_webhook_payload(
 
     # Phase 2: Make IG calls outside of any DB session (may be rate-limited)
     positions_data, working_orders_data = await _fetch_ig_positions_and_orders(
-        user, payload
+        user, payload, payload_data
     )
 
     # Validate maximum pending orders (no DB needed here)
@@ -484,9 +533,10 @@ async def validate_webhook_payload(
         maximum_open_positions,
         payload,
         working_orders_data,
+        payload_data,
     )
     if not is_valid:
-        return is_valid, error_code
+        return is_valid, error_code, None, None
 
     # Validate maximum open positions and pending orders combined (no DB needed here)
     (
@@ -499,9 +549,10 @@ async def validate_webhook_payload(
         maximum_open_positions_and_pending_orders,
         positions_data,
         working_orders_data,
+        payload_data,
     )
     if not is_valid:
-        return is_valid, error_code
+        return is_valid, error_code, None, None
 
     # Validate position or working order does not already exist (based on IG data)
     is_valid, error_code = await _validate_position_or_working_order_does_not_exist(
@@ -512,9 +563,10 @@ async def validate_webhook_payload(
         prevent_duplicate_positions_for_instrument,
         positions_data,
         working_orders_data,
+        payload_data,
     )
     if not is_valid:
-        return is_valid, error_code
+        return is_valid, error_code, None, None
 
     # Validate dividend date constraints
     is_valid, error_code = await _validate_dividend_date(
@@ -522,8 +574,9 @@ async def validate_webhook_payload(
         user_id,
         avoid_dividend_dates,
         instrument_next_dividend_date,
+        payload_data,
     )
     if not is_valid:
-        return is_valid, error_code
+        return is_valid, error_code, None, None
 
-    return True, None
+    return True, None, user, instrument
@@ -1,5 +1,7 @@
+import hashlib
 import secrets
 import string
+from typing import Optional
 
 from app.config import settings
 
@@ -10,6 +12,18 @@ def generate_webhook_secret(length: int = settings.WEBHOOK_SECRET_LENGTH) -> str
     return "".join(secrets.choice(alphabet) for _ in range(length))
 
 
+def webhook_secret_lookup_hash(secret: Optional[str]) -> Optional[bytes]:
+    """
+    Hash a webhook secret down to the fixed-width key it is indexed by.
+
+    Kept computable in SQL (`substring(sha256(...) FROM 1 FOR 8)`) so
+    migrations can backfill it in a single UPDATE.
+    """
+    if secret is None:
+        return None
+    return hashlib.sha256(secret.encode()).digest()[:8]
+
+
 def generate_deal_reference(length: int = 16) -> str:
     """Generate a secure random variable-length string for deal references."""
     alphabet = string.ascii_uppercase + string.digits
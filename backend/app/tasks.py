@@ -5,21 +5,23 @@ from datetime import datetime, timedelta, timezone
 
 import dramatiq
 from app.api.schemas.webhook import WebhookPayload
-from app.config import LOGGING_CONFIG, settings
-from app.db.crud import get_all_orders_with_deal_id, get_user_by_id
+from app.config import build_logging_config, settings
+from app.db.crud import get_orders_with_deal_id_batch, get_user_by_id
 from app.db.deps import get_db_context
 from app.db.models import Order, User
 from app.services.dividend_dates import (
     fetch_and_update_all_dividend_dates,
     fetch_and_update_dividend_dates_for_user,
 )
+from app.services.logging.buffer import flush_logs
 from app.services.order_fulfillment import (
     check_order_conversion,
     delete_expired_orders_for_user,
 )
 from app.services.trading.handler import handle_alert
+from dramatiq.asyncio import get_event_loop_thread
 from dramatiq.brokers.rabbitmq import RabbitmqBroker
-from dramatiq.middleware import AsyncIO
+from dramatiq.middleware import AsyncIO, Middleware
 from dramatiq.rate_limits import BucketRateLimiter
 from dramatiq.rate_limits.backends import RedisBackend
 from periodiq import PeriodiqMiddleware, cron
@@ -33,14 +35,41 @@ limiter = BucketRateLimiter(
     bucket=60_000,
 )
 
+
+class LoggingConfigMiddleware(Middleware):
+    """Apply the app logging config once a worker process has booted."""
+
+    def after_process_boot(self, broker):
+        logging.config.dictConfig(build_logging_config())
+
+
+class FlushLogsMiddleware(Middleware):
+    """
+    Write queued log entries before the worker's event loop is stopped.
+
+    After-hooks run in reverse order, so this must be added after AsyncIO for
+    it to run while the loop is still alive.
+    """
+
+    def after_worker_shutdown(self, broker, worker):
+        event_loop_thread = get_event_loop_thread()
+        if event_loop_thread is None:
+            return
+
+        try:
+            event_loop_thread.run_coroutine(flush_logs())
+        except Exception:
+            logger.exception("Failed to flush queued log entries on shutdown")
+
+
 broker = RabbitmqBroker(url=settings.DRAMATIQ_BROKER_URL)
 broker.add_middleware(AsyncIO())
 broker.add_middleware(PeriodiqMiddleware(skip_delay=30))
+broker.add_middleware(LoggingConfigMiddleware())
+broker.add_middleware(FlushLogsMiddleware())
 
 dramatiq.set_broker(broker)
 
-logging.config.dictConfig(LOGGING_CONFIG)
-
 logger = logging.getLogger(__name__)
 
 DIVIDEND_DATE_UPDATE_SCHEDULE = cron(settings.DIVIDEND_DATE_UPDATE_SCHEDULE)
@@ -145,20 +174,22 @@ async def check_order_conversions():
     """
     logger.info("Starting order conversion check task")
 
-    async with get_db_context() as db:
-        try:
-            # Get all orders that have deal IDs
-            orders = await get_all_orders_with_deal_id(db)
+    try:
+        checked_count = 0
+        last_order_id = None
 
-            if not orders:
-                logger.info("No orders with deal IDs found for conversion check")
-                return
+        # Walk the orders in keyset batches; each batch is read in its own
+        # short session so no transaction stays open across the IG calls
+        with limiter.acquire():
+            while True:
+                async with get_db_context() as db:
+                    orders = await get_orders_with_deal_id_batch(db, last_order_id)
 
-            logger.info(f"Checking conversion status for {len(orders)} orders")
+                if not orders:
+                    break
 
-            # Check each order for conversion
-            with limiter.acquire():
                 for order in orders:
+                    checked_count += 1
                     try:
                         await check_order_conversion(order)
                     except Exception as e:
@@ -168,11 +199,20 @@ async def check_order_conversions():
                         )
                         # Continue with other orders even if one fails
 
-            logger.info("Successfully completed order conversion check task")
+                last_order_id = orders[-1].id
 
-        except Exception as e:
-            logger.error(f"Error in check_order_conversions task: {str(e)}")
-            raise
+        if not checked_count:
+            logger.info("No orders with deal IDs found for conversion check")
+            return
+
+        logger.info(
+            f"Successfully completed order conversion check task - "
+            f"checked {checked_count} orders"
+        )
+
+    except Exception as e:
+        logger.error(f"Error in check_order_conversions task: {str(e)}")
+        raise
 
 
 @dramatiq.actor(
@@ -0,0 +1,90 @@
+"""
+The msgspec structs in app.clients.ig.structs mirror the pydantic models in
+app.clients.ig.types by hand. Decoding the same IG payload through both must
+give identical models, so the two definitions can't drift apart unnoticed.
+"""
+
+import json
+
+from app.clients.ig.structs import HISTORY_DECODER, POSITIONS_DECODER
+from app.clients.ig.types import GetHistoryResponse, PositionsResponse
+
+# Trimmed from real GET /positions (v2) and GET /history/activity (v3) responses
+POSITIONS_PAYLOAD = json.dumps(
+    {
+        "positions": [
+            {
+                "position": {
+                    "contractSize": 1.0,
+                    "createdDate": "2024/08/08 12:41:23:000",
+                    "createdDateUTC": "2024-08-08T11:41:23",
+                    "dealId": "DIAAAAQ6ABCDEF",
+                    "dealReference": "7YQ2NXR8DL4TC8Q",
+                    "size": 2.5,
+                    "direction": "BUY",
+                    "limitLevel": None,
+                    "level": 1234.5,
+                    "currency": "GBP",
+                    "controlledRisk": False,
+                    "stopLevel": 1200.25,
+                    "trailingStep": None,
+                    "trailingStopDistance": None,
+                    "limitedRiskPremium": None,
+                },
+                "market": {
+                    "instrumentName": "Apple Inc (All Sessions)",
+                    "expiry": "DFB",
+                    "epic": "UA.D.AAPL.DAILY.IP",
+                    "instrumentType": "SHARES",
+                    "lotSize": 1.0,
+                    "high": 220.1,
+                    "low": 215.3,
+                    "percentageChange": -0.45,
+                    "netChange": -1.0,
+                    "bid": 218.0,
+                    "offer": 218.4,
+                    "updateTime": "16:59:58",
+                    "updateTimeUTC": "15:59:58",
+                    "delayTime": 0,
+                    "streamingPricesAvailable": True,
+                    "marketStatus": "TRADEABLE",
+                    "scalingFactor": 1,
+                },
+            }
+        ]
+    }
+)
+
+HISTORY_PAYLOAD = json.dumps(
+    {
+        "activities": [
+            {
+                "date": "2024-08-08T12:41:23",
+                "epic": "UA.D.AAPL.DAILY.IP",
+                "period": "DFB",
+                "dealId": "DIAAAAQ6ABCDEF",
+                "channel": "PUBLIC_WEB_API",
+                "type": "POSITION",
+                "status": "ACCEPTED",
+                "description": "Position opened: ABCDEF",
+                "details": None,
+            }
+        ],
+        "metadata": {"paging": {"size": 1, "next": None}},
+    }
+)
+
+
+def test_positions_decoder_matches_pydantic():
+    decoded = POSITIONS_DECODER.decode(POSITIONS_PAYLOAD).to_pydantic()
+    validated = PositionsResponse.model_validate_json(POSITIONS_PAYLOAD)
+
+    assert decoded == validated
+
+
+def test_history_decoder_matches_pydantic():
+    decoded = HISTORY_DECODER.decode(HISTORY_PAYLOAD).to_pydantic()
+    validated = GetHistoryResponse.model_validate_json(HISTORY_PAYLOAD)
+
+    assert decoded == validated
+    assert decoded.activities[0].date.utcoffset().total_seconds() == 0